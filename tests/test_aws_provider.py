@@ -0,0 +1,319 @@
+"""
+Tests for the AWS Secrets Manager provider.
+"""
+
+import pytest
+
+from use_env.providers import ProviderError
+from use_env.providers.aws import AwsSecretsProvider
+
+CREDENTIALS = '{"username": "admin", "password": "hunter2"}'
+
+
+class FakeClient:
+    """Stands in for an aiobotocore Secrets Manager client."""
+
+    def __init__(self, secrets, batch_supported=True):
+        self.secrets = secrets
+        self.batch_supported = batch_supported
+        self.batches = []
+        self.gets = []
+
+    async def batch_get_secret_value(self, SecretIdList):
+        self.batches.append(list(SecretIdList))
+        if not self.batch_supported:
+            raise AttributeError("batch_get_secret_value")
+        return {
+            "SecretValues": [
+                {"Name": name, "ARN": f"arn:{name}", "SecretString": self.secrets[name]}
+                for name in SecretIdList
+                if name in self.secrets
+            ],
+            "Errors": [
+                {"SecretId": name, "ErrorCode": "ResourceNotFoundException"}
+                for name in SecretIdList
+                if name not in self.secrets
+            ],
+        }
+
+    async def get_secret_value(self, SecretId):
+        from botocore.exceptions import ClientError
+
+        self.gets.append(SecretId)
+        if SecretId not in self.secrets:
+            error = {"Error": {"Code": "ResourceNotFoundException"}}
+            raise ClientError(error, "GetSecretValue")
+        return {"Name": SecretId, "SecretString": self.secrets[SecretId]}
+
+
+class TestAwsSecretsProvider:
+    """Tests for the AwsSecretsProvider class."""
+
+    @pytest.fixture(autouse=True)
+    def clear_shared_cache(self):
+        """Keep the process-wide secret cache from leaking between tests."""
+        AwsSecretsProvider.clear_shared_cache()
+        yield
+        AwsSecretsProvider.clear_shared_cache()
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Drive the cache clock by hand."""
+        import use_env.providers.aws as aws_module
+
+        now = [100.0]
+        monkeypatch.setattr(aws_module.time, "monotonic", lambda: now[0])
+        return now
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        """Create a provider that reads secrets from a dict instead of AWS."""
+        return self._dict_backed(monkeypatch, {})
+
+    @staticmethod
+    def _dict_backed(monkeypatch, secrets):
+        """Build a provider whose fetches read secrets, recording each one."""
+        provider = AwsSecretsProvider()
+        provider.secrets = secrets
+        provider.fetches = []
+
+        async def fetch_secret(region, secret_name):
+            provider.fetches.append(secret_name)
+            value = provider.secrets[secret_name]
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        monkeypatch.setattr(provider, "_fetch_secret", fetch_secret)
+        return provider
+
+    @pytest.mark.parametrize(
+        ("stored", "expected"),
+        [
+            ('{"token": "abc"}', "abc"),
+            (CREDENTIALS, "hunter2"),
+            ('{"db": "from-name", "user": "admin"}', "from-name"),
+            ('{"user": "admin", "host": "db"}', '{"user": "admin", "host": "db"}'),
+            ("plain-text", "plain-text"),
+            ("{not json", "{not json"),
+            ('["a", "b"]', '["a", "b"]'),
+        ],
+    )
+    def test_decode_without_suffix(self, stored, expected):
+        """Test the only-value, password and secret-name rules for plain references."""
+        assert AwsSecretsProvider._decode_secret("db", stored) == expected
+
+    @pytest.mark.parametrize(
+        ("flag", "expected"),
+        [
+            ("raw", CREDENTIALS),
+            ("json", CREDENTIALS),
+            ("key=username", "admin"),
+        ],
+    )
+    def test_decode_with_suffix(self, flag, expected):
+        """Test that each suffix overrides the default rules."""
+        assert AwsSecretsProvider._decode_secret("db", CREDENTIALS, flag) == expected
+
+    def test_decode_key_serializes_non_string_values(self):
+        """Test that #key= returns non-string JSON values as JSON."""
+        stored = '{"port": 5432, "hosts": ["a", "b"]}'
+
+        assert AwsSecretsProvider._decode_secret("db", stored, "key=port") == "5432"
+        assert AwsSecretsProvider._decode_secret("db", stored, "key=hosts") == '["a", "b"]'
+
+    @pytest.mark.parametrize(
+        ("flag", "expected"),
+        [
+            (None, CREDENTIALS),
+            ("raw", CREDENTIALS),
+            ("json", CREDENTIALS),
+            ("key=password", "hunter2"),
+        ],
+    )
+    def test_decode_binary_secret(self, flag, expected):
+        """Test that SecretBinary values are decoded, without key rules unless asked."""
+        stored = CREDENTIALS.encode()
+
+        assert AwsSecretsProvider._decode_secret("db", stored, flag) == expected
+
+    @pytest.mark.asyncio
+    async def test_resolve_suffixes(self, provider):
+        """Test that suffixed references to one secret resolve from a single fetch."""
+        provider.secrets["app/db"] = CREDENTIALS
+
+        assert await provider.resolve("us-east-1/app/db") == "hunter2"
+        assert await provider.resolve("us-east-1/app/db#raw") == CREDENTIALS
+        assert await provider.resolve("us-east-1/app/db#key=username") == "admin"
+
+    @pytest.mark.asyncio
+    async def test_json_suffix_rejects_non_json(self, provider):
+        """Test that #json on a plain-text secret raises a ProviderError."""
+        provider.secrets["app/token"] = "plain-text"
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.resolve("us-east-1/app/token#json")
+
+        assert "as json" in str(exc_info.value)
+        assert exc_info.value.reference == "us-east-1/app/token#json"
+
+    @pytest.mark.asyncio
+    async def test_missing_key_raises(self, provider):
+        """Test that #key= naming an absent key raises a ProviderError."""
+        provider.secrets["app/db"] = CREDENTIALS
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.resolve("us-east-1/app/db#key=port")
+
+        assert "as key=port" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_across_instances_and_close(self, monkeypatch):
+        """Test that a fetched secret is reused by other instances and after close."""
+        secrets = {"app/db": CREDENTIALS}
+        first = self._dict_backed(monkeypatch, secrets)
+        second = self._dict_backed(monkeypatch, secrets)
+
+        assert await first.resolve("us-east-1/app/db") == "hunter2"
+        await first.close()
+
+        assert await second.resolve("us-east-1/app/db#key=username") == "admin"
+        assert first.fetches == ["app/db"]
+        assert second.fetches == []
+
+    @staticmethod
+    def _client_error(code, status=400):
+        """Build the botocore ClientError a failed GetSecretValue raises."""
+        from botocore.exceptions import ClientError
+
+        response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+        return ClientError(response, "GetSecretValue")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("code", "status"), [("ThrottlingException", 400), ("Unknown", 503)])
+    async def test_serves_stale_value_when_refresh_fails(self, provider, clock, code, status):
+        """Test that a transient refresh failure after the ttl falls back to the last value."""
+        pytest.importorskip("botocore")
+        provider.configure({"cache_ttl": 10})
+        provider.secrets["app/db"] = CREDENTIALS
+        assert await provider.resolve("us-east-1/app/db") == "hunter2"
+
+        clock[0] += 11
+        provider.secrets["app/db"] = self._client_error(code, status)
+
+        assert await provider.resolve("us-east-1/app/db") == "hunter2"
+        assert provider.fetches == ["app/db", "app/db"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("code", ["ResourceNotFoundException", "AccessDeniedException"])
+    async def test_permanent_failure_is_not_served_stale(self, provider, clock, code):
+        """Test that a missing or forbidden secret fails instead of serving the old value."""
+        pytest.importorskip("botocore")
+        provider.configure({"cache_ttl": 10})
+        provider.secrets["app/db"] = CREDENTIALS
+        await provider.resolve("us-east-1/app/db")
+
+        clock[0] += 11
+        provider.secrets["app/db"] = self._client_error(code)
+
+        with pytest.raises(ProviderError):
+            await provider.resolve("us-east-1/app/db")
+
+    @pytest.mark.asyncio
+    async def test_stale_value_expires_after_max_stale(self, provider, clock):
+        """Test that a stale value is only served for max_stale seconds past the ttl."""
+        pytest.importorskip("botocore")
+        provider.configure({"cache_ttl": 10, "max_stale": 60})
+        provider.secrets["app/db"] = CREDENTIALS
+        await provider.resolve("us-east-1/app/db")
+
+        provider.secrets["app/db"] = self._client_error("ThrottlingException")
+        clock[0] += 69
+        assert await provider.resolve("us-east-1/app/db") == "hunter2"
+
+        clock[0] += 2
+        with pytest.raises(ProviderError):
+            await provider.resolve("us-east-1/app/db")
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_is_bounded(self, provider):
+        """Test that cache_maxsize evicts the least recently fetched secrets."""
+        maxsize = AwsSecretsProvider._shared_cache.maxsize
+        try:
+            provider.configure({"cache_maxsize": 2})
+            provider.secrets.update({"app/a": "A", "app/b": "B", "app/c": "C"})
+            for name in ("a", "b", "c"):
+                await provider.resolve(f"us-east-1/app/{name}")
+
+            assert len(AwsSecretsProvider._shared_cache) == 2
+            await provider.resolve("us-east-1/app/a")
+            assert provider.fetches == ["app/a", "app/b", "app/c", "app/a"]
+        finally:
+            AwsSecretsProvider._shared_cache.maxsize = maxsize
+
+    @pytest.mark.asyncio
+    async def test_failure_without_cached_value_raises(self, provider):
+        """Test that a failed fetch with nothing cached raises for the reference."""
+        provider.secrets["app/db"] = ProviderError("throttled")
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.resolve("us-east-1/app/db")
+
+        assert "throttled" in str(exc_info.value)
+
+    @staticmethod
+    def _client_backed(monkeypatch, client):
+        """Build a provider that talks to client for every region."""
+        pytest.importorskip("botocore")
+        provider = AwsSecretsProvider()
+
+        async def get_client(region, reference):
+            return client
+
+        monkeypatch.setattr(provider, "_get_client", get_client)
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_chunks_batch_calls(self, monkeypatch):
+        """Test that uncached secrets are fetched 20 per BatchGetSecretValue call."""
+        secrets = {f"app/s{i}": f"value{i}" for i in range(45)}
+        client = FakeClient(secrets)
+        provider = self._client_backed(monkeypatch, client)
+        references = [f"us-east-1/{name}" for name in secrets]
+
+        results = await provider.resolve_batch(references)
+
+        assert results == {f"us-east-1/{name}": value for name, value in secrets.items()}
+        assert sorted(len(chunk) for chunk in client.batches) == [5, 20, 20]
+        assert client.gets == []
+
+        # A second batch is served from the shared cache
+        await provider.resolve_batch(references)
+        assert len(client.batches) == 3
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_reports_missing_secret(self, monkeypatch):
+        """Test that a secret the batch call could not return fails on its own."""
+        client = FakeClient({"app/db": CREDENTIALS})
+        provider = self._client_backed(monkeypatch, client)
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.resolve_batch(["us-east-1/app/db", "us-east-1/app/missing"])
+
+        assert exc_info.value.reference == "us-east-1/app/missing"
+        assert "not found" in str(exc_info.value)
+        assert client.gets == ["app/missing"]
+        # The secret the batch did return is cached for the individual resolve
+        assert await provider.resolve("us-east-1/app/db") == "hunter2"
+        assert client.gets == ["app/missing"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_falls_back_without_batch_api(self, monkeypatch):
+        """Test that a failing batch call falls back to one fetch per secret."""
+        client = FakeClient({"app/a": "A", "app/b": "B"}, batch_supported=False)
+        provider = self._client_backed(monkeypatch, client)
+
+        results = await provider.resolve_batch(["us-east-1/app/a", "us-east-1/app/b"])
+
+        assert results == {"us-east-1/app/a": "A", "us-east-1/app/b": "B"}
+        assert sorted(client.gets) == ["app/a", "app/b"]
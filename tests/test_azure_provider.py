@@ -0,0 +1,35 @@
+"""
+Tests for the Azure Key Vault provider.
+"""
+
+import pytest
+
+from use_env.providers.azure import AzureKeyVaultProvider
+
+
+class TestAzureKeyVaultProvider:
+    """Tests for the AzureKeyVaultProvider class."""
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        """Create a provider whose SDK reads are recorded instead of sent."""
+        provider = AzureKeyVaultProvider()
+        provider.calls = []
+
+        async def fetch_secret(vault_name, secret_name):
+            provider.calls.append((vault_name, secret_name))
+            return f"{vault_name}:{secret_name}"
+
+        monkeypatch.setattr(provider, "_fetch_secret", fetch_secret)
+        return provider
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("config", "expected_calls"), [({}, 1), ({"cache_ttl": 0}, 2)])
+    async def test_resolve_batch_honours_cache_ttl(self, provider, config, expected_calls):
+        """Test that a second batch reuses the cache unless cache_ttl is 0."""
+        provider.configure(config)
+
+        for _ in range(2):
+            assert await provider.resolve_batch(["vault/db"]) == {"vault/db": "vault:db"}
+
+        assert len(provider.calls) == expected_calls
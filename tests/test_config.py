@@ -34,6 +34,15 @@ class TestProviderConfig:
         assert config.enabled is True
         assert config.config == {}
 
+    def test_default_config_is_shared_and_read_only(self):
+        """Test that unset configs share one read-only empty mapping."""
+        first = ProviderConfig(name="a", type="test")
+        second = ProviderConfig(name="b", type="test")
+
+        assert first.config is second.config
+        with pytest.raises(TypeError):
+            first.config["key"] = "value"  # type: ignore[index]
+
 
 class TestUseEnvConfig:
     """Tests for the UseEnvConfig class."""
@@ -108,6 +117,28 @@ options:
         assert config.providers == []
         assert config.global_options == {}
 
+    def test_load_reuses_unchanged_config(self, temp_dir):
+        """Test that an unchanged file is parsed once and edits are picked up."""
+        config_path = temp_dir / "config.yaml"
+        config_path.write_text("options:\n  strict: true\n")
+
+        first = UseEnvConfig.load(str(config_path))
+        assert UseEnvConfig.load(str(config_path)) is first
+
+        config_path.write_text("options:\n  strict: false\n")
+        reloaded = UseEnvConfig.load(str(config_path))
+
+        assert reloaded is not first
+        assert reloaded.global_options == {"strict": False}
+
+    def test_find_config_file_prefers_dotfile(self, temp_dir, monkeypatch):
+        """Test that the working directory candidates keep their order."""
+        (temp_dir / "use-env.yml").write_text("")
+        (temp_dir / ".use-env.yml").write_text("")
+        monkeypatch.chdir(temp_dir)
+
+        assert UseEnvConfig._find_config_file() == str(temp_dir / ".use-env.yml")
+
     def test_get_provider_config(self, temp_dir):
         """Test getting a specific provider config."""
         config_content = """
@@ -128,6 +159,20 @@ providers:
         assert result is not None
         assert result.name == "provider1"
 
+    def test_get_provider_config_prefers_first_duplicate(self):
+        """Test that the first provider wins when names repeat."""
+        config = UseEnvConfig(
+            providers=[
+                ProviderConfig(name="dup", type="first"),
+                ProviderConfig(name="dup", type="second"),
+            ]
+        )
+
+        result = config.get_provider_config("dup")
+
+        assert result is not None
+        assert result.type == "first"
+
     def test_get_nonexistent_provider_config(self, temp_dir):
         """Test getting a nonexistent provider returns None."""
         config = UseEnvConfig()
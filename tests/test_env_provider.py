@@ -92,3 +92,27 @@ class TestEnvironmentProvider:
         result = await provider.resolve("TEST_VAR")
 
         assert result == "new_value"
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch(self):
+        """Test batch resolution from one environment snapshot."""
+        provider = EnvironmentProvider()
+
+        results = await provider.resolve_batch(["TEST_VAR", "env:ANOTHER_VAR"])
+
+        assert results == {"TEST_VAR": "test_value", "env:ANOTHER_VAR": "another_value"}
+
+        with pytest.raises(ProviderError):
+            await provider.resolve_batch(["TEST_VAR", "MISSING_VAR"])
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self):
+        """Test that cache_enabled: false always reads the current environment."""
+        provider = EnvironmentProvider()
+        provider.configure({"cache_enabled": False})
+
+        await provider.resolve("TEST_VAR")
+        os.environ["TEST_VAR"] = "modified_value"
+
+        assert await provider.resolve("TEST_VAR") == "modified_value"
+        assert provider.cached_value("TEST_VAR") is None
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from use_env.loader import EnvLoader
 from use_env.providers import ProviderError
 from use_env.providers.file import FileProvider
 
@@ -57,6 +58,15 @@ class TestFileProvider:
 
         assert "not found" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_eager_read(self, secret_file):
+        """Test reading a file on the event loop with eager mode."""
+        provider = FileProvider(eager=True)
+
+        result = await provider.resolve(str(secret_file))
+
+        assert result == "super_secret_value"
+
     @pytest.mark.asyncio
     async def test_relative_path_with_base(self, temp_dir):
         """Test reading a relative path with base directory."""
@@ -72,7 +82,7 @@ class TestFileProvider:
     @pytest.mark.asyncio
     async def test_caching(self, secret_file):
         """Test that values are cached."""
-        provider = FileProvider()
+        provider = FileProvider(check_mtime=False)
 
         result1 = await provider.resolve(str(secret_file))
 
@@ -85,6 +95,88 @@ class TestFileProvider:
         assert result1 == "super_secret_value"
         assert result2 == "super_secret_value"
 
+    @pytest.mark.asyncio
+    async def test_caching_rereads_modified_file(self, secret_file):
+        """Test that a changed modification time invalidates the cached value."""
+        provider = FileProvider()
+
+        result1 = await provider.resolve(str(secret_file))
+
+        # Modify the file and move its mtime so the change is always visible
+        stat = secret_file.stat()
+        secret_file.write_text("modified_secret")
+        os.utime(secret_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result2 = await provider.resolve(str(secret_file))
+
+        assert result1 == "super_secret_value"
+        assert result2 == "modified_secret"
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch(self, temp_dir, secret_file):
+        """Test batch reads, including mtime checks between batches."""
+        other_file = temp_dir / "other.txt"
+        other_file.write_text("other_value")
+
+        provider = FileProvider()
+        provider.configure({"batch_concurrency": 1})
+        references = [str(secret_file), str(other_file)]
+
+        result1 = await provider.resolve_batch(references)
+
+        stat = secret_file.stat()
+        secret_file.write_text("modified_secret")
+        os.utime(secret_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result2 = await provider.resolve_batch(references)
+
+        assert result1 == {str(secret_file): "super_secret_value", str(other_file): "other_value"}
+        assert result2[str(secret_file)] == "modified_secret"
+
+    @pytest.mark.asyncio
+    async def test_aliased_paths_share_cache(self, temp_dir, secret_file):
+        """Test that different spellings of one path are read once."""
+        provider = FileProvider(base_path=str(temp_dir), check_mtime=False)
+        references = ["secret.txt", "./secret.txt", str(secret_file)]
+
+        result = await provider.resolve_batch(references)
+        secret_file.write_text("modified_secret")
+
+        assert set(result.values()) == {"super_secret_value"}
+        assert len(provider._cache) == 1
+        assert await provider.resolve("sub/../secret.txt") == "super_secret_value"
+
+    @pytest.mark.asyncio
+    async def test_warm_then_load_rereads_modified_file(self, secret_file):
+        """Test that warmed values still go through the mtime check when loading."""
+        provider = FileProvider()
+        await provider.warm([str(secret_file)])
+
+        stat = secret_file.stat()
+        secret_file.write_text("modified_secret")
+        os.utime(secret_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        loader = EnvLoader()
+        loader._providers["file"] = provider
+        loader.refresh_providers()
+        result = await loader.load(stdin_content=f"A=${{file:{secret_file}}}\n", output_path="-")
+
+        assert result.resolved_content == "A=modified_secret\n"
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_cached_value_without_mtime_check(self, secret_file):
+        """Test that cached_value serves the cache only when mtimes are not checked."""
+        checked = FileProvider()
+        unchecked = FileProvider(check_mtime=False)
+        for provider in (checked, unchecked):
+            await provider.resolve(str(secret_file))
+
+        assert checked.cached_value(str(secret_file)) is None
+        assert unchecked.cached_value(str(secret_file)) == "super_secret_value"
+        assert unchecked.cached_value(f"file://{secret_file}") == "super_secret_value"
+
     @pytest.mark.asyncio
     async def test_close_clears_cache(self, secret_file):
         """Test that close clears the cache."""
@@ -0,0 +1,48 @@
+"""
+Tests for the GCP Secret Manager provider.
+"""
+
+import pytest
+
+from use_env.providers.gcp import GcpSecretsProvider
+
+
+class TestGcpSecretsProvider:
+    """Tests for the GcpSecretsProvider class."""
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        """Create a provider whose SDK reads are recorded instead of sent."""
+        provider = GcpSecretsProvider()
+        provider.calls = []
+
+        async def fetch_secret(project_id, secret_name, version):
+            provider.calls.append((project_id, secret_name, version))
+            return f"{secret_name}@{version}"
+
+        monkeypatch.setattr(provider, "_fetch_secret", fetch_secret)
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_cached_value(self, provider):
+        """Test that cached_value reads the cache, treating a missing version as latest."""
+        assert provider.cached_value("proj/db") is None
+
+        assert await provider.resolve("proj/db") == "db@latest"
+
+        assert provider.cached_value("proj/db") == "db@latest"
+        assert provider.cached_value("proj/db/latest") == "db@latest"
+        assert provider.cached_value("proj/db/2") is None
+        assert provider.cached_value("proj") is None
+        assert provider.calls == [("proj", "db", "latest")]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("config", "expected_calls"), [({}, 1), ({"cache_ttl": 0}, 2)])
+    async def test_resolve_batch_honours_cache_ttl(self, provider, config, expected_calls):
+        """Test that a second batch reuses the cache unless cache_ttl is 0."""
+        provider.configure(config)
+
+        for _ in range(2):
+            assert await provider.resolve_batch(["proj/db"]) == {"proj/db": "db@latest"}
+
+        assert len(provider.calls) == expected_calls
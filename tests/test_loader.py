@@ -2,12 +2,15 @@
 Tests for the environment file loader.
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from use_env import loader as loader_module
 from use_env.loader import EnvFileError, EnvLoader, EnvVariable, SecretReference
+from use_env.providers import Provider, ProviderError, ProviderInfo
 
 
 class TestEnvLoader:
@@ -46,7 +49,7 @@ PLAIN_VALUE=just_a_string
 
         content = env_file.read_text()
         lines = content.splitlines()
-        variables = loader._parse_lines(lines)
+        variables, _ = loader._parse_lines(lines)
 
         assert len(variables) == 5
 
@@ -64,9 +67,8 @@ PLAIN_VALUE=just_a_string
         loader = EnvLoader()
 
         content = env_file.read_text()
-        lines = content.splitlines()
-        variables = loader._parse_lines(lines)
-        references = loader._find_references(content, variables)
+        lines = content.splitlines(keepends=True)
+        _, references = loader._parse_lines(lines)
 
         assert len(references) == 2
 
@@ -74,6 +76,7 @@ PLAIN_VALUE=just_a_string
         env_ref = next(r for r in references if r.provider_name == "env")
         assert env_ref.key == "API_KEY"
         assert env_ref.reference == "TEST_API_KEY"
+        assert content[env_ref.start_pos : env_ref.end_pos] == "${env:TEST_API_KEY}"
 
         # Check file reference (now uses absolute path)
         file_ref = next(r for r in references if r.provider_name == "file")
@@ -92,7 +95,7 @@ UNQUOTED=no_quotes
         loader = EnvLoader()
         content = file_path.read_text()
         lines = content.splitlines()
-        variables = loader._parse_lines(lines)
+        variables, _ = loader._parse_lines(lines)
 
         assert variables[0].value == "value in quotes"
         assert variables[1].value == "single quoted"
@@ -114,7 +117,7 @@ KEY=value
         loader = EnvLoader()
         content = file_path.read_text()
         lines = content.splitlines()
-        variables = loader._parse_lines(lines)
+        variables, _ = loader._parse_lines(lines)
 
         assert len(variables) == 1
         assert variables[0].key == "KEY"
@@ -131,7 +134,7 @@ ANOTHER_VALID=value2
         loader = EnvLoader()
         content = file_path.read_text()
         lines = content.splitlines()
-        variables = loader._parse_lines(lines)
+        variables, _ = loader._parse_lines(lines)
 
         assert len(variables) == 2
         assert variables[0].key == "VALID_KEY"
@@ -280,6 +283,21 @@ API_KEY=static_value
 
         await loader.close()
 
+    @pytest.mark.asyncio
+    async def test_stdin_stream_input(self, secret_file):
+        """Test that piped input can be given as a text stream."""
+        import io
+
+        stream = io.StringIO(f"DB_PASSWORD=${{file:{secret_file}}}\n")
+
+        loader = EnvLoader()
+        result = await loader.load(stdin_stream=stream, output_path="-")
+
+        assert result.input_path == Path("-")
+        assert result.resolved_content == "DB_PASSWORD=file_secret_value\n"
+
+        await loader.close()
+
     @pytest.mark.asyncio
     async def test_output_to_stdout(self, temp_dir, env_file, secret_file):
         """Test output to stdout (output_path='-')."""
@@ -306,6 +324,359 @@ API_KEY=static_value
 
         await loader.close()
 
+    @pytest.mark.asyncio
+    async def test_unregistered_prefixes_are_left_untouched(self):
+        """Test that ${...} tokens without a known provider are not references."""
+        loader = EnvLoader()
+
+        content = "A=${nope:one}\nB=${HOME:-/root}\n"
+        result = await loader.load(stdin_content=content, output_path="-", strict=False)
+
+        assert result.secrets_resolved == 0
+        assert result.errors == []
+        assert result.resolved_content == content
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_providers_reported_together_in_strict_mode(self):
+        """Test that strict mode lists every unknown provider before resolving."""
+        loader = EnvLoader()
+
+        content = "A=${nope:one}\nB=${missing:two}\nC=${HOME:-/root}\n# D=${comment:x}\n"
+        with pytest.raises(EnvFileError) as exc_info:
+            await loader.load(stdin_content=content, output_path="-", strict=True)
+
+        assert str(exc_info.value) == "Unknown provider(s): missing, nope"
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_references_substituted_only_in_values(self):
+        """Test that output substitution follows the parsed reference spans."""
+
+        class EchoProvider(Provider):
+            info = ProviderInfo(name="echo", description="Echo provider")
+
+            async def resolve(self, reference: str) -> str:
+                return reference.upper()
+
+        loader = EnvLoader()
+        loader._providers["echo"] = EchoProvider()
+        loader.refresh_providers()
+
+        content = "# uses ${echo:a}\nA=${echo:a}-${echo:b}\nB=${echo:c}\n"
+        result = await loader.load(stdin_content=content, output_path="-")
+
+        assert result.resolved_content == "# uses ${echo:a}\nA=A-B\nB=C\n"
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_configured_providers_created_on_first_use(self):
+        """Test that configured providers are only instantiated when referenced."""
+        from use_env.config import ProviderConfig, UseEnvConfig
+        from use_env.providers import ProviderRegistry
+
+        class CountingProvider(Provider):
+            info = ProviderInfo(name="lazy-counting", description="Counting provider")
+            created = 0
+
+            def __init__(self) -> None:
+                type(self).created += 1
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+        if not ProviderRegistry.is_registered("lazy-counting"):
+            ProviderRegistry.register(CountingProvider)
+
+        config = UseEnvConfig(
+            providers=[
+                ProviderConfig(name="used", type="lazy-counting"),
+                ProviderConfig(name="unused", type="not-a-registered-type"),
+            ]
+        )
+        loader = EnvLoader(config)
+        provider_class = ProviderRegistry.snapshot()["lazy-counting"]
+        before = provider_class.created
+
+        result = await loader.load(stdin_content="A=${used:value}\n", output_path="-")
+
+        assert result.resolved_content == "A=value\n"
+        assert provider_class.created == before + 1
+        assert "unused" not in loader._providers
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_providers_come_from_the_snapshot(self, monkeypatch):
+        """Test that a provider unregistered after construction still resolves."""
+        from use_env.providers import ProviderRegistry
+
+        monkeypatch.setenv("TEST_VAR", "test_value")
+        loader = EnvLoader()
+        monkeypatch.delitem(ProviderRegistry._providers, "env")
+
+        result = await loader.load(
+            stdin_content="A=${env:TEST_VAR}\n", output_path="-", strict=False
+        )
+
+        assert result.resolved_content == "A=test_value\n"
+        assert result.errors == []
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_unregistered_configured_type_is_a_resolution_error(self):
+        """Test that a configured provider of an unknown type fails per reference."""
+        from use_env.config import ProviderConfig, UseEnvConfig
+
+        config = UseEnvConfig(providers=[ProviderConfig(name="broken", type="no-such-type")])
+        loader = EnvLoader(config)
+
+        content = "A=${broken:one}\nB=${broken:two}\nC=plain\n"
+        result = await loader.load(stdin_content=content, output_path="-", strict=False)
+
+        assert [error.key for error in result.errors] == ["A", "B"]
+        assert "no-such-type" in result.errors[0].message
+        assert result.resolved_content == content
+
+        with pytest.raises(EnvFileError, match="no-such-type"):
+            await loader.load(stdin_content=content, output_path="-", strict=True)
+
+        await loader.close()
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_resolution(self):
+        """Test that max_concurrency limits in-flight resolutions."""
+        import asyncio
+
+        from use_env.config import UseEnvConfig
+
+        class SlowProvider(Provider):
+            info = ProviderInfo(name="slow", description="Slow provider")
+
+            def __init__(self) -> None:
+                self.active = 0
+                self.peak = 0
+
+            async def resolve(self, reference: str) -> str:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                return reference
+
+        provider = SlowProvider()
+        loader = EnvLoader(UseEnvConfig(global_options={"max_concurrency": 2}))
+        loader._providers["slow"] = provider
+
+        content = "".join(f"K{i}=${{slow:ref{i}}}\n" for i in range(6))
+        result = await loader.load(stdin_content=content, output_path="-")
+
+        assert result.secrets_resolved == 6
+        assert provider.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_references_resolved_once(self):
+        """Test that a reference used by several variables is resolved once."""
+
+        class CountingProvider(Provider):
+            info = ProviderInfo(name="counting", description="Counting provider")
+
+            def __init__(self) -> None:
+                self.calls: list[str] = []
+
+            async def resolve(self, reference: str) -> str:
+                self.calls.append(reference)
+                return f"value-{reference}"
+
+        provider = CountingProvider()
+        loader = EnvLoader()
+        loader._providers["counting"] = provider
+
+        content = "A=${counting:db}\nB=${counting:db}\nC=x-${counting:db}\n"
+        result = await loader.load(stdin_content=content, output_path="-")
+
+        assert provider.calls == ["db"]
+        assert result.resolved_content.count("value-db") == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_values_skip_resolve(self):
+        """Test that references the provider has cached are not resolved again."""
+
+        class CachingProvider(Provider):
+            info = ProviderInfo(name="caching", description="Caching provider")
+
+            def __init__(self) -> None:
+                self.calls: list[str] = []
+
+            async def resolve(self, reference: str) -> str:
+                self.calls.append(reference)
+                return f"value-{reference}"
+
+            def cached_value(self, reference: str) -> str | None:
+                return "cached-a" if reference == "a" else None
+
+        provider = CachingProvider()
+        loader = EnvLoader()
+        loader._providers["caching"] = provider
+
+        content = "A=${caching:a}\nB=${caching:b}\n"
+        result = await loader.load(stdin_content=content, output_path="-")
+
+        assert provider.calls == ["b"]
+        assert result.resolved_content == "A=cached-a\nB=value-b\n"
+
+    @pytest.mark.asyncio
+    async def test_batch_provider_resolves_group_once(self):
+        """Test that providers overriding resolve_batch get one call per load."""
+
+        class BatchProvider(Provider):
+            info = ProviderInfo(name="batch", description="Batch provider")
+
+            def __init__(self) -> None:
+                self.batches: list[list[str]] = []
+
+            async def resolve(self, reference: str) -> str:
+                raise ProviderError("not found", provider="batch", reference=reference)
+
+            async def resolve_batch(self, references, progress_callback=None):
+                self.batches.append(references)
+                return {ref: f"value-{ref}" for ref in references if ref != "missing"}
+
+        provider = BatchProvider()
+        loader = EnvLoader()
+        loader._providers["batch"] = provider
+
+        content = "A=${batch:one}\nB=${batch:two}\nC=${batch:one}\nD=${batch:missing}\n"
+        result = await loader.load(stdin_content=content, output_path="-", strict=False)
+
+        assert provider.batches == [["one", "two", "missing"]]
+        assert "A=value-one" in result.resolved_content
+        assert "B=value-two" in result.resolved_content
+        assert "C=value-one" in result.resolved_content
+        assert len(result.errors) == 1
+        assert result.errors[0].key == "D"
+
+    @pytest.mark.asyncio
+    async def test_http_providers_share_loader_session(self):
+        """Test that HTTP providers use one loader session, closed with the loader."""
+        pytest.importorskip("aiohttp")
+        sessions = []
+
+        class HttpProvider(Provider):
+            info = ProviderInfo(name="http", description="HTTP provider")
+            uses_http = True
+
+            async def resolve(self, reference: str) -> str:
+                sessions.append(self.lent_http_session())
+                return reference
+
+        first, second = HttpProvider(), HttpProvider()
+        loader = EnvLoader()
+        loader._providers["one"] = first
+        loader._providers["two"] = second
+        loader.refresh_providers()
+
+        await loader.load(stdin_content="A=${one:a}\nB=${two:b}\n", output_path="-")
+
+        session = sessions[0]
+        assert session is not None
+        assert sessions == [session, session]
+        # The session is lent for the load, never stored on the provider
+        assert first.http_session is None
+        assert first.lent_http_session() is None
+
+        await loader.close()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loaders_keep_their_own_sessions(self):
+        """Test that loaders sharing a provider each resolve through their own session."""
+        pytest.importorskip("aiohttp")
+        seen = {}
+
+        class HttpProvider(Provider):
+            info = ProviderInfo(name="http", description="HTTP provider")
+            uses_http = True
+
+            async def resolve(self, reference: str) -> str:
+                session = self.lent_http_session()
+                # Let the other loader run in between
+                await asyncio.sleep(0)
+                assert self.lent_http_session() is session
+                seen[reference] = session
+                return reference
+
+        shared = HttpProvider()
+        loaders = [EnvLoader(), EnvLoader()]
+        for loader in loaders:
+            loader._providers["http"] = shared
+            loader.refresh_providers()
+
+        await asyncio.gather(
+            loaders[0].load(stdin_content="A=${http:a}\n", output_path="-"),
+            loaders[1].load(stdin_content="B=${http:b}\n", output_path="-"),
+        )
+        assert seen["a"] is loaders[0]._http_session
+        assert seen["b"] is loaders[1]._http_session
+        assert seen["a"] is not seen["b"]
+
+        await loaders[0].close()
+
+        assert seen["a"].closed
+        assert not seen["b"].closed
+
+        await loaders[1].close()
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_providers_open(self):
+        """Test that close keeps providers open and a session they were given."""
+        pytest.importorskip("aiohttp")
+        sessions = []
+
+        class HttpProvider(Provider):
+            info = ProviderInfo(name="http", description="HTTP provider")
+            uses_http = True
+
+            def __init__(self):
+                super().__init__()
+                self.closed = False
+
+            async def resolve(self, reference: str) -> str:
+                sessions.append(self.lent_http_session())
+                return reference
+
+            async def close(self) -> None:
+                await super().close()
+                self.closed = True
+
+        provider = HttpProvider()
+        own_session = object()
+        provider.http_session = own_session
+        loader = EnvLoader()
+        loader._providers["one"] = provider
+        loader.refresh_providers()
+
+        await loader.load(stdin_content="A=${one:a}\n", output_path="-")
+        await loader.close()
+
+        assert sessions == [own_session]
+        assert provider.http_session is own_session
+        assert not provider.closed
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_read_input_matches_read_text(self, temp_dir, monkeypatch, newline):
+        """Test that memory-mapped reads decode the same text as read_text."""
+        monkeypatch.setattr(loader_module, "_MMAP_THRESHOLD", 1)
+        env_path = temp_dir / "large.env"
+        env_path.write_bytes(newline.join(["A=1", "B=${env:HOME}", ""]).encode())
+
+        assert loader_module._read_input(env_path) == env_path.read_text()
+
 
 class TestEnvVariable:
     """Tests for the EnvVariable dataclass."""
@@ -0,0 +1,240 @@
+"""
+Tests for the 1Password Connect provider.
+"""
+
+import json
+
+import pytest
+
+from use_env.loader import EnvLoader
+from use_env.providers import ProviderError, onepassword
+from use_env.providers.onepassword import OnePasswordProvider, _field_value
+
+aiohttp = pytest.importorskip("aiohttp")
+
+
+class FakeResponse:
+    """A canned aiohttp response."""
+
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.reason = "Reason"
+        self.ok = status < 400
+        self.headers = headers or {}
+        self._body = json.dumps(body or {}).encode()
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeSession:
+    """Stands in for the loader's shared session.
+
+    Responses are looked up by URL path in routes, else replayed in order.
+    """
+
+    def __init__(self, *responses, routes=None):
+        self.responses = list(responses)
+        self.routes = routes or {}
+        self.paths = []
+
+    def get(self, url, headers=None):
+        self.paths.append(url.path)
+        response = self.routes.get(url.path) or self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def field(value, cache_control=None):
+    """Build a field response, optionally with a Cache-Control header."""
+    headers = {"Cache-Control": cache_control} if cache_control else None
+    return FakeResponse(body={"id": "password", "value": value}, headers=headers)
+
+
+ITEM_PATH = "/v1/vaults/vault/items/item"
+ITEM = FakeResponse(
+    body={
+        "id": "item",
+        "fields": [
+            {"id": "f1", "label": "username", "value": "admin"},
+            {"id": "f2", "label": "password", "value": "hunter2"},
+        ],
+    }
+)
+
+
+class TestOnePasswordProvider:
+    """Tests for the OnePasswordProvider class."""
+
+    @pytest.fixture
+    def provider(self):
+        """Create a provider configured for a fake Connect server."""
+        provider = OnePasswordProvider()
+        provider.configure({"connect_url": "http://connect", "connect_token": "token"})
+        return provider
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Drive the cache clock by hand."""
+        import use_env.providers as providers_module
+
+        now = [100.0]
+        monkeypatch.setattr(providers_module.time, "monotonic", lambda: now[0])
+        return now
+
+    @pytest.mark.asyncio
+    async def test_max_age_expires_between_batches(self, provider, clock):
+        """Test that a Cache-Control max-age bounds reuse across batches."""
+        session = provider.http_session = FakeSession(
+            field("first", "max-age=10"), field("second", "max-age=10")
+        )
+        reference = "vault/item/password"
+
+        assert await provider.resolve_batch([reference]) == {reference: "first"}
+        clock[0] += 5
+        assert await provider.resolve_batch([reference]) == {reference: "first"}
+        clock[0] += 6
+        assert await provider.resolve_batch([reference]) == {reference: "second"}
+
+        assert len(session.paths) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_store_refetches_every_batch(self, provider):
+        """Test that a no-store response is not reused by the next batch."""
+        session = provider.http_session = FakeSession(
+            field("first", "no-store"), field("second", "no-store")
+        )
+        reference = "vault/item/password"
+
+        assert await provider.resolve_batch([reference]) == {reference: "first"}
+        assert await provider.resolve_batch([reference]) == {reference: "second"}
+
+        assert len(session.paths) == 2
+
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            ({"id": "password", "value": "plain"}, "plain"),
+            ({"value": 'say "hi"\\now'}, 'say "hi"\\now'),
+            ({"value": "caf\u00e9 \u2603"}, "caf\u00e9 \u2603"),
+            ({"value": "top", "section": {"value": "nested"}}, "top"),
+            ({"section": {"value": "nested"}, "value": "top"}, "top"),
+            ({"section": {"value": "nested"}}, ""),
+            ({"value": 42}, "42"),
+        ],
+    )
+    def test_field_value(self, body, expected):
+        """Test that only the top-level value is read, whatever the escapes or order."""
+        assert _field_value(json.dumps(body).encode()) == expected
+
+    @pytest.mark.asyncio
+    async def test_fields_of_one_item_cost_one_request(self, provider):
+        """Test that a batch reads a shared item once and serves its fields from it."""
+        session = provider.http_session = FakeSession(routes={ITEM_PATH: ITEM})
+        references = ["vault/item/username", "vault/item/password", "vault/item/f1"]
+
+        results = await provider.resolve_batch(references)
+
+        assert results == dict(zip(references, ["admin", "hunter2", "admin"]))
+        assert session.paths == [ITEM_PATH]
+
+    @pytest.mark.asyncio
+    async def test_missing_item_field_fails_alone(self, provider):
+        """Test that a field absent from a read item errors only for its reference."""
+        session = provider.http_session = FakeSession(
+            routes={ITEM_PATH: ITEM, f"{ITEM_PATH}/fields/missing": FakeResponse(404)}
+        )
+        loader = EnvLoader()
+        loader._providers["1password"] = provider
+        loader.refresh_providers()
+
+        content = "A=${1password:vault/item/username}\nB=${1password:vault/item/missing}\n"
+        result = await loader.load(stdin_content=content, output_path="-", strict=False)
+
+        assert "A=admin" in result.resolved_content
+        assert [error.key for error in result.errors] == ["B"]
+        assert "not found" in result.errors[0].message
+        assert session.paths.count(ITEM_PATH) == 1
+
+        with pytest.raises(ProviderError):
+            await provider.resolve("vault/item/missing")
+
+        await loader.close()
+
+    @pytest.fixture
+    def no_backoff(self, monkeypatch):
+        """Retry immediately instead of sleeping between attempts."""
+        monkeypatch.setattr(onepassword, "_RETRY_BACKOFF", 0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "failure", [FakeResponse(503), FakeResponse(429), aiohttp.ClientConnectionError()]
+    )
+    async def test_retries_transient_failures(self, provider, no_backoff, failure):
+        """Test that a transient status or connection error is retried."""
+        session = provider.http_session = FakeSession(failure, field("value"))
+
+        assert await provider.resolve("vault/item/password") == "value"
+        assert len(session.paths) == 2
+
+    @pytest.mark.parametrize("max_attempts", [0, -1])
+    def test_rejects_max_attempts_below_one(self, provider, max_attempts):
+        """Test that max_attempts must allow at least one request."""
+        with pytest.raises(ProviderError) as exc_info:
+            provider.configure({"max_attempts": max_attempts})
+
+        assert "max_attempts" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_single_attempt_raises_last_error(self, provider, no_backoff):
+        """Test that max_attempts of 1 raises the transient error without retrying."""
+        provider.configure({"max_attempts": 1})
+        session = provider.http_session = FakeSession(FakeResponse(503), field("value"))
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.resolve("vault/item/password")
+
+        assert "503" in str(exc_info.value)
+        assert len(session.paths) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [401, 404])
+    async def test_does_not_retry_client_errors(self, provider, no_backoff, status):
+        """Test that authentication and not-found errors fail on the first attempt."""
+        session = provider.http_session = FakeSession(FakeResponse(status), field("value"))
+
+        with pytest.raises(ProviderError):
+            await provider.resolve("vault/item/password")
+
+        assert len(session.paths) == 1
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_and_resets(self, provider, no_backoff, clock):
+        """Test that repeated failures fail fast until the cooldown, then calls resume."""
+        provider.configure({"max_attempts": 1})
+        threshold = onepassword._BREAKER_THRESHOLD
+        session = provider.http_session = FakeSession(
+            *(FakeResponse(503) for _ in range(threshold)), field("value")
+        )
+
+        for i in range(threshold):
+            with pytest.raises(ProviderError, match="503"):
+                await provider.resolve(f"vault/item/field{i}")
+
+        # Open: no request is sent
+        with pytest.raises(ProviderError, match="unavailable"):
+            await provider.resolve("vault/item/password")
+        assert len(session.paths) == threshold
+
+        # After the cooldown a request goes through again, and success closes it
+        clock[0] += onepassword._BREAKER_COOLDOWN
+        assert await provider.resolve("vault/item/password") == "value"
+        assert len(session.paths) == threshold + 1
+        assert provider._failures == 0
@@ -2,6 +2,8 @@
 Tests for the provider interface and registry.
 """
 
+import asyncio
+
 import pytest
 import pytest_asyncio
 
@@ -10,6 +12,8 @@ from use_env.providers import (
     ProviderError,
     ProviderInfo,
     ProviderRegistry,
+    TTLCache,
+    shared_client,
 )
 
 
@@ -56,6 +60,7 @@ class TestProvider:
         """Test reference validation with a pattern."""
         assert mock_provider.validate_reference("valid_value") is True
         assert mock_provider.validate_reference("another-value") is True
+        assert mock_provider.validate_reference("") is False
 
     @pytest.mark.asyncio
     async def test_validate_reference_without_pattern(self):
@@ -73,6 +78,33 @@ class TestProvider:
         provider = NoPatternProvider()
         assert provider.validate_reference("any_value") is True
 
+    def test_validate_reference_specialized_per_subclass(self):
+        """Test that subclasses validate against their own pattern."""
+
+        class DigitsProvider(Provider):
+            info = ProviderInfo(name="digits", description="Digits", reference_pattern=r"^\d+$")
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+        class LettersProvider(DigitsProvider):
+            info = ProviderInfo(
+                name="letters", description="Letters", reference_pattern=r"^[a-z]+$"
+            )
+
+        class CustomProvider(DigitsProvider):
+            def validate_reference(self, reference: str) -> bool:
+                return reference == "custom"
+
+        assert DigitsProvider._compiled_pattern is not None
+        assert DigitsProvider._compiled_pattern.pattern == r"^\d+$"
+        assert DigitsProvider().validate_reference("123") is True
+        assert DigitsProvider().validate_reference("abc") is False
+        assert LettersProvider().validate_reference("abc") is True
+        assert LettersProvider().validate_reference("123") is False
+        assert CustomProvider().validate_reference("custom") is True
+        assert CustomProvider().validate_reference("123") is False
+
     @pytest.mark.asyncio
     async def test_resolve_batch(self, mock_provider):
         """Test batch resolution."""
@@ -84,6 +116,278 @@ class TestProvider:
         assert results["ref2"] == "resolved:ref2"
         assert results["ref3"] == "resolved:ref3"
 
+    @pytest.mark.asyncio
+    async def test_resolve_batch_max_concurrency(self):
+        """Test that batch resolution respects max_concurrency."""
+
+        class SlowProvider(Provider):
+            info = ProviderInfo(name="slow", description="Slow provider")
+
+            def __init__(self):
+                self.active = 0
+                self.peak = 0
+
+            async def resolve(self, reference: str) -> str:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                return reference
+
+        provider = SlowProvider()
+        references = [f"ref{i}" for i in range(6)]
+        results = await provider.resolve_batch(references, max_concurrency=2)
+
+        assert list(results) == references
+        assert provider.peak == 2
+
+        # Without max_concurrency the configured batch_concurrency applies
+        provider.configure({"batch_concurrency": 3})
+        provider.peak = 0
+        await provider.resolve_batch(references)
+
+        assert provider.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_resolve_cached_shares_lookups(self):
+        """Test that repeated references hit the backend once."""
+
+        class CountingProvider(Provider):
+            info = ProviderInfo(name="counting", description="Counting provider")
+
+            def __init__(self):
+                self.calls = []
+
+            async def resolve(self, reference: str) -> str:
+                self.calls.append(reference)
+                await asyncio.sleep(0)
+                return reference.upper()
+
+        provider = CountingProvider()
+        results = await provider.resolve_batch(["a", "b", "a"], max_concurrency=1)
+
+        assert results == {"a": "A", "b": "B"}
+        assert provider.calls == ["a", "b"]
+        assert provider.cached_value("a") is None
+
+        assert await provider.resolve_cached("a") == "A"
+        assert await provider.resolve_cached("a") == "A"
+        assert provider.calls == ["a", "b", "a"]
+        assert provider.cached_value("a") == "A"
+        assert provider.cached_value("c") is None
+
+        await provider.close()
+        assert provider.cached_value("a") is None
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_respects_provider_cache_ttl(self):
+        """Test that cache_ttl 0 refetches across batches through the default batch."""
+
+        class TTLProvider(Provider):
+            info = ProviderInfo(name="ttl", description="TTL provider")
+
+            def __init__(self):
+                self.calls = []
+                self._cache = TTLCache.from_config({"cache_ttl": 0})
+
+            async def resolve(self, reference: str) -> str:
+                cached = self._cache.get(reference)
+                if cached is not None:
+                    return cached
+                self.calls.append(reference)
+                self._cache[reference] = reference.upper()
+                return reference.upper()
+
+            def cached_value(self, reference: str) -> str | None:
+                return self._cache.get(reference)
+
+        provider = TTLProvider()
+
+        assert await provider.resolve_batch(["a"]) == {"a": "A"}
+        assert await provider.resolve_batch(["a"]) == {"a": "A"}
+        assert provider.calls == ["a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_cached_retries_failures(self):
+        """Test that failed lookups are not memoized."""
+
+        class FlakyProvider(Provider):
+            info = ProviderInfo(name="flaky", description="Flaky provider")
+
+            def __init__(self):
+                self.calls = 0
+
+            async def resolve(self, reference: str) -> str:
+                self.calls += 1
+                if self.calls == 1:
+                    raise ProviderError("temporary failure")
+                return reference
+
+        provider = FlakyProvider()
+
+        with pytest.raises(ProviderError):
+            await provider.resolve_cached("ref")
+        assert await provider.resolve_cached("ref") == "ref"
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_shares_inflight_fetches(self, mock_provider):
+        """Test that concurrent fetches for a key share one call, later ones refetch."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "value"
+
+        results = await asyncio.gather(*(mock_provider._coalesce("key", fetch) for _ in range(3)))
+
+        assert results == ["value"] * 3
+        assert len(calls) == 1
+
+        assert await mock_provider._coalesce("key", fetch) == "value"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_fills_cache_and_ignores_errors(self):
+        """Test that warm caches good references once and swallows failures."""
+
+        class CountingProvider(Provider):
+            info = ProviderInfo(name="counting", description="Counting provider")
+
+            def __init__(self):
+                self.calls = []
+
+            async def resolve(self, reference: str) -> str:
+                self.calls.append(reference)
+                if reference == "bad":
+                    raise ProviderError("bad reference")
+                return reference.upper()
+
+        provider = CountingProvider()
+        await provider.warm(["a", "bad", "a", "b"])
+
+        assert provider.cached_value("a") == "A"
+        assert provider.cached_value("b") == "B"
+        assert provider.calls.count("a") == 1
+        assert provider.calls.count("b") == 1
+        assert provider.cached_value("bad") is None
+
+    @pytest.mark.asyncio
+    async def test_warm_falls_back_when_batch_raises(self):
+        """Test that a failing batch still warms the references that resolve."""
+
+        class BatchDownProvider(Provider):
+            info = ProviderInfo(name="batch-down", description="Failing batch provider")
+
+            def __init__(self):
+                self.calls = []
+                self._cache = TTLCache()
+
+            async def resolve(self, reference: str) -> str:
+                self.calls.append(reference)
+                if reference == "bad":
+                    raise ProviderError("bad reference")
+                self._cache[reference] = reference.upper()
+                return reference.upper()
+
+            def cached_value(self, reference: str) -> str | None:
+                return self._cache.get(reference)
+
+            async def resolve_batch(self, references, progress_callback=None, max_concurrency=None):
+                raise ProviderError("batch API unavailable")
+
+        provider = BatchDownProvider()
+        provider._cache["c"] = "C"
+
+        await provider.warm(["a", "bad", "b", "c"])
+
+        assert provider.cached_value("a") == "A"
+        assert provider.cached_value("b") == "B"
+        assert provider.cached_value("bad") is None
+        assert sorted(provider.calls) == ["a", "b", "bad"]
+
+
+class TestTTLCache:
+    """Tests for the TTLCache used by providers."""
+
+    def test_expires_entries(self, monkeypatch):
+        """Test that entries expire after the ttl."""
+        import use_env.providers as providers_module
+
+        now = [100.0]
+        monkeypatch.setattr(providers_module.time, "monotonic", lambda: now[0])
+
+        cache = TTLCache(ttl=10)
+        cache["a"] = "A"
+        assert cache.get("a") == "A"
+
+        now[0] += 10
+        assert "a" not in cache
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2, ttl=None)
+        cache["a"] = "A"
+        cache["b"] = "B"
+        assert cache.get("a") == "A"
+
+        cache["c"] = "C"
+
+        assert "b" not in cache
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+
+    def test_from_config(self):
+        """Test building a cache from provider config, including disabling it."""
+        cache = TTLCache.from_config({"cache_maxsize": 5, "cache_ttl": 0})
+        cache["a"] = "A"
+
+        assert (cache.maxsize, cache.ttl) == (5, 0.0)
+        assert cache.get("a") is None
+
+    def test_set_with_shorter_ttl(self, monkeypatch):
+        """Test that a per-entry ttl can shorten, but not extend, the cache ttl."""
+        import use_env.providers as providers_module
+
+        now = [100.0]
+        monkeypatch.setattr(providers_module.time, "monotonic", lambda: now[0])
+
+        cache = TTLCache(ttl=10)
+        cache.set("short", "S", ttl=5)
+        cache.set("long", "L", ttl=60)
+        cache.set("skip", "X", ttl=0)
+        assert "skip" not in cache
+
+        now[0] += 5
+        assert "short" not in cache
+        assert cache.get("long") == "L"
+
+        now[0] += 5
+        assert "long" not in cache
+
+
+class TestSharedClient:
+    """Tests for the process-wide client cache."""
+
+    def test_builds_each_client_once(self, monkeypatch):
+        """Test that a key's factory runs once and keys don't share clients."""
+        import use_env.providers as providers_module
+
+        monkeypatch.setattr(providers_module, "_CLIENTS", {})
+        built = []
+
+        def factory():
+            built.append(object())
+            return built[-1]
+
+        first = shared_client(("azure-keyvault", "https://a"), factory)
+
+        assert shared_client(("azure-keyvault", "https://a"), factory) is first
+        assert shared_client(("vault", "https://a"), factory) is not first
+        assert len(built) == 2
+
 
 class TestProviderRegistry:
     """Tests for the ProviderRegistry class."""
@@ -135,6 +439,25 @@ class TestProviderRegistry:
         with pytest.raises(KeyError):
             ProviderRegistry.register(DuplicateProvider)
 
+    def test_register_exist_ok_keeps_existing(self):
+        """Test that exist_ok leaves an existing registration in place."""
+
+        class FirstProvider(Provider):
+            info = ProviderInfo(name="dup", description="First")
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+        class SecondProvider(FirstProvider):
+            pass
+
+        ProviderRegistry.register(FirstProvider)
+        ProviderRegistry.register(FirstProvider, exist_ok=True)
+        ProviderRegistry.register(SecondProvider, exist_ok=True)
+
+        assert isinstance(ProviderRegistry.get("dup"), FirstProvider)
+        assert not isinstance(ProviderRegistry.get("dup"), SecondProvider)
+
     def test_register_without_info_raises_error(self):
         """Test that registering a provider without info raises an error."""
 
@@ -181,6 +504,8 @@ class TestProviderRegistry:
                 return reference
 
         ProviderRegistry.register(Provider1)
+        assert [p.name for p in ProviderRegistry.list_providers()] == ["p1"]
+
         ProviderRegistry.register(Provider2)
 
         providers = ProviderRegistry.list_providers()
@@ -188,6 +513,50 @@ class TestProviderRegistry:
         assert len(providers) == 2
         names = {p.name for p in providers}
         assert names == {"p1", "p2"}
+        assert ProviderRegistry.list_providers() is providers
+
+    def test_list_names_uses_registration_names(self):
+        """Test that list_names reports custom registration names."""
+
+        class TestProvider(Provider):
+            info = ProviderInfo(name="original", description="Test")
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+        ProviderRegistry.register(TestProvider, name="custom")
+
+        assert ProviderRegistry.list_names() == ["custom"]
+
+    def test_snapshot_is_a_copy(self):
+        """Test that later registrations do not change an earlier snapshot."""
+
+        class TestProvider(Provider):
+            info = ProviderInfo(name="snap", description="Test")
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+        snapshot = ProviderRegistry.snapshot()
+        ProviderRegistry.register(TestProvider)
+
+        assert "snap" not in snapshot
+        assert ProviderRegistry.snapshot() == {"snap": TestProvider}
+
+    def test_get_with_provider_class(self):
+        """Test that get can instantiate a class from a snapshot by name."""
+
+        class TestProvider(Provider):
+            info = ProviderInfo(name="snap", description="Test")
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+        instance = ProviderRegistry.get("snap", provider_class=TestProvider)
+
+        assert isinstance(instance, TestProvider)
+        assert ProviderRegistry.get("snap", provider_class=TestProvider) is instance
+        assert not ProviderRegistry.is_registered("snap")
 
     def test_provider_caching(self):
         """Test that provider instances are cached."""
@@ -205,6 +574,56 @@ class TestProviderRegistry:
 
         assert instance1 is instance2
 
+    def test_provider_caching_with_config(self):
+        """Test that configured instances are cached per configuration."""
+
+        class TestProvider(Provider):
+            info = ProviderInfo(name="test", description="Test")
+            configured = 0
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+            def configure(self, config: dict) -> None:
+                TestProvider.configured += 1
+                self.region = config["region"]
+
+        ProviderRegistry.register(TestProvider)
+
+        first = ProviderRegistry.get("test", {"region": "a", "profile": "p"})
+        again = ProviderRegistry.get("test", {"profile": "p", "region": "a"})
+        other = ProviderRegistry.get("test", {"region": "b"})
+
+        assert first is again
+        assert other is not first
+        assert (first.region, other.region) == ("a", "b")
+        assert TestProvider.configured == 2
+        assert ProviderRegistry.get("test") is not first
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_instances(self):
+        """Test that aclose closes cached instances inside a running loop."""
+        closed = []
+
+        class TestProvider(Provider):
+            info = ProviderInfo(name="test", description="Test")
+
+            async def resolve(self, reference: str) -> str:
+                return reference
+
+            async def close(self) -> None:
+                closed.append(self)
+
+        ProviderRegistry.register(TestProvider)
+        first = ProviderRegistry.get("test")
+        second = ProviderRegistry.get("test", {"region": "a"})
+
+        await ProviderRegistry.aclose()
+
+        assert sorted(map(id, closed)) == sorted([id(first), id(second)])
+        assert ProviderRegistry.is_registered("test")
+        assert ProviderRegistry.get("test") is not first
+
 
 class TestProviderError:
     """Tests for ProviderError exception."""
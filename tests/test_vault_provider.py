@@ -0,0 +1,58 @@
+"""
+Tests for the HashiCorp Vault provider.
+"""
+
+import pytest
+
+from use_env.providers import hashicorp
+from use_env.providers.hashicorp import HashiCorpVaultProvider
+
+MULTI_FIELD = {"user": "admin", "note": "café"}
+MULTI_FIELD_JSON = '{"user":"admin","note":"café"}'
+
+
+class TestHashiCorpVaultProvider:
+    """Tests for the HashiCorpVaultProvider class."""
+
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        """Create a provider whose Vault reads are recorded instead of sent."""
+        provider = HashiCorpVaultProvider()
+        provider.calls = []
+
+        async def load_secret(mount_point, secret_path, reference):
+            provider.calls.append((mount_point, secret_path))
+            data = {"user": "admin", "password": "hunter2"}
+            provider._secrets[(mount_point, secret_path)] = data
+            return data
+
+        monkeypatch.setattr(provider, "_load_secret", load_secret)
+        return provider
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("config", "expected_calls"), [({}, 1), ({"cache_ttl": 0}, 2)])
+    async def test_resolve_batch_honours_cache_ttl(self, provider, config, expected_calls):
+        """Test that a second batch reuses the cache unless cache_ttl is 0."""
+        provider.configure(config)
+        references = ["secret/app/user", "secret/app/password"]
+
+        for _ in range(2):
+            results = await provider.resolve_batch(references)
+            assert results == {"secret/app/user": "admin", "secret/app/password": "hunter2"}
+
+        assert provider.calls == [("secret", "app")] * expected_calls
+
+    @pytest.mark.asyncio
+    async def test_whole_secret_is_compact_json(self, provider):
+        """Test that a multi-field secret without a field resolves to compact JSON."""
+        provider._secrets[("secret", "app")] = MULTI_FIELD
+
+        assert await provider.resolve("secret/app") == MULTI_FIELD_JSON
+        assert provider.calls == []
+
+    def test_json_backends_agree(self):
+        """Test that the json fallback and orjson serialize secrets identically."""
+        assert hashicorp._stdlib_json_dumps(MULTI_FIELD) == MULTI_FIELD_JSON
+
+        orjson = pytest.importorskip("orjson")
+        assert orjson.dumps(MULTI_FIELD).decode() == MULTI_FIELD_JSON
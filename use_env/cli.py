@@ -7,15 +7,15 @@ This module provides the CLI entry point and argument parsing.
 from __future__ import annotations
 
 import asyncio
-import os
 import sys
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 import yaml
 from rich import print as rprint
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
 
 from .config import UseEnvConfig
 from .loader import EnvFileError, EnvLoader
@@ -24,11 +24,23 @@ from .providers import ProviderRegistry
 # Import to register built-in providers
 from .providers.built_in import register_built_in_providers  # noqa: F401
 
+if TYPE_CHECKING:
+    import argparse
+
+_VERSION = "use-env 1.0.0"
+
+try:
+    # libyaml-backed dumper, much faster than the pure-Python SafeDumper
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 
 def main() -> int:
     """Main entry point for the CLI."""
     try:
-        return asyncio.run(_main_async())
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            return runner.run(_main_async())
     except KeyboardInterrupt:
         rprint("[yellow]Cancelled.[/yellow]")
         return 130
@@ -37,18 +49,55 @@ def main() -> int:
         return 1
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory when installed, else the default."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+@cache
 def _is_piped() -> bool:
-    """Check if stdout is a pipe (piping to another command)."""
-    return not os.isatty(sys.stdout.fileno())
+    """Check if stdout is a pipe (piping to another command).
+
+    The answer cannot change during a run, so it is computed once.
+    """
+    return not sys.stdout.isatty()
 
 
+@cache
 def _has_stdin() -> bool:
-    """Check if stdin has data (for piping)."""
+    """Check if stdin has data (for piping).
+
+    The answer cannot change during a run, so it is computed once.
+    """
     return not sys.stdin.isatty()
 
 
-async def _main_async() -> int:
-    """Async main function."""
+def _fast_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the common invocations without building the argparse parser.
+
+    Handles no arguments or a single input file. Returns None for anything
+    else so the full parser handles it (including errors).
+    """
+    if len(argv) > 1 or (argv and argv[0].startswith("-")):
+        return None
+
+    return SimpleNamespace(
+        input=argv[0] if argv else None,
+        output=None,
+        strict=False,
+        config=None,
+        list_providers=False,
+        provider_help=None,
+        verbose=0,
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full command-line parser."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -107,7 +156,7 @@ Examples:
     parser.add_argument(
         "--version",
         action="version",
-        version="use-env 1.0.0",
+        version=_VERSION,
     )
 
     parser.add_argument(
@@ -118,7 +167,19 @@ Examples:
         help="Increase verbosity (can be used multiple times)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+async def _main_async() -> int:
+    """Async main function."""
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        print(_VERSION)
+        return 0
+
+    args = _fast_args(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
 
     # Discover plugin-based providers registered via entry points
     ProviderRegistry.discover_plugins()
@@ -135,7 +196,8 @@ Examples:
     is_piped = _is_piped()
     has_stdin = _has_stdin()
 
-    # Handle input source
+    # Handle input source; build the input Path once and reuse it below
+    input_path: Path | None = None
     if args.input == "-":
         # Explicit stdin
         input_source = "stdin"
@@ -145,10 +207,12 @@ Examples:
             input_source = "stdin"
         else:
             # Default file
-            args.input = ".env.dev"
-            input_source = str(Path(args.input).resolve())
+            input_path = Path(".env.dev")
     else:
-        input_source = str(Path(args.input).resolve())
+        input_path = Path(args.input)
+
+    if input_path is not None:
+        input_source = str(input_path.resolve())
 
     # Handle output destination
     if args.output == "-":
@@ -162,8 +226,7 @@ Examples:
         # BUT if input is from stdin, output to stdout
         if input_source == "stdin":
             output_to_stdout = True
-        elif args.input:
-            input_path = Path(args.input)
+        elif input_path is not None:
             if input_path.is_absolute() or input_path.exists():
                 args.output = str(input_path.parent / ".env")
             else:
@@ -177,7 +240,7 @@ Examples:
 
     return await _process_file(
         input_source=input_source,
-        input_path=args.input,
+        input_path=input_path,
         output_path=args.output,
         output_to_stdout=output_to_stdout,
         strict=args.strict,
@@ -192,6 +255,10 @@ def _display_provider_help(provider_name: str) -> None:
     Providers can populate ProviderInfo.help with setup, configuration,
     and credential instructions. This function renders that help.
     """
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.table import Table
+
     providers = {p.name: p for p in ProviderRegistry.list_providers()}
 
     if provider_name not in providers:
@@ -224,6 +291,8 @@ def _display_provider_help(provider_name: str) -> None:
 
 def _display_providers() -> None:
     """Display all available providers."""
+    from rich.table import Table
+
     providers = ProviderRegistry.list_providers()
 
     if not providers:
@@ -247,7 +316,7 @@ def _display_providers() -> None:
 
 async def _process_file(
     input_source: str,
-    input_path: str | None,
+    input_path: Path | None,
     output_path: str | None,
     output_to_stdout: bool,
     strict: bool,
@@ -265,9 +334,8 @@ async def _process_file(
     if output_to_stdout:
         final_output_path = "-"
     elif output_path is None:
-        if input_path:
-            input_file = Path(input_path)
-            final_output_path = str(input_file.parent / ".env")
+        if input_path is not None:
+            final_output_path = str(input_path.parent / ".env")
         else:
             final_output_path = ".env"
     else:
@@ -276,16 +344,11 @@ async def _process_file(
     loader = EnvLoader(config)
 
     try:
-        # Read from stdin if needed
-        stdin_content: str | None = None
-        if input_source == "stdin":
-            stdin_content = sys.stdin.read()
-
         result = await loader.load(
             input_path=input_path,
             output_path=final_output_path,
             strict=strict,
-            stdin_content=stdin_content,
+            stdin_stream=sys.stdin if input_source == "stdin" else None,
         )
 
         if verbose > 0:
@@ -318,10 +381,29 @@ async def _process_file(
         return 1
     finally:
         await loader.close()
+        await ProviderRegistry.aclose()
 
     return 0
 
 
 def _display_config(config: UseEnvConfig) -> None:
     """Display configuration."""
-    rprint(Panel.fit(yaml.dump(config.__dict__, default_flow_style=False), title="Configuration"))
+    from rich.panel import Panel
+
+    data = {
+        "providers": [
+            {
+                "name": provider.name,
+                "type": provider.type,
+                "enabled": provider.enabled,
+                "config": dict(provider.config),
+            }
+            for provider in config.providers
+        ],
+        "global_options": dict(config.global_options),
+    }
+    rprint(
+        Panel.fit(
+            yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False), title="Configuration"
+        )
+    )
@@ -7,29 +7,70 @@ including user-defined providers and global settings.
 
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass
+# Shared read-only default for option mappings that were not set
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Config file names looked up in the working directory, in order of preference
+_CWD_CONFIG_NAMES = (".use-env.yaml", ".use-env.yml", "use-env.yaml", "use-env.yml")
+
+# Parsed configs keyed by absolute path, tagged with the (mtime_ns, size)
+# they were parsed from so edits to the file are picked up
+_CONFIG_CACHE: dict[str, tuple[int, int, UseEnvConfig]] = {}
+
+
+@cache
+def _home_config_paths() -> tuple[Path, Path]:
+    """Config locations under the home directory, resolved once per process."""
+    home = Path.home()
+    return (home / ".config" / "use-env.yaml", home / ".use-env.yaml")
+
+
+@dataclass(slots=True, frozen=True)
 class ProviderConfig:
     """Configuration for a single provider."""
 
     name: str
     type: str
     enabled: bool = True
-    config: dict[str, Any] = field(default_factory=dict)
+    config: Mapping[str, Any] = _EMPTY_MAPPING
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UseEnvConfig:
-    """Main configuration for use-env."""
+    """Main configuration for use-env.
+
+    The provider list is indexed by name on construction, so treat
+    ``providers`` as read-only once the config has been created.
+    """
 
     providers: list[ProviderConfig] = field(default_factory=list)
-    global_options: dict[str, Any] = field(default_factory=dict)
+    global_options: Mapping[str, Any] = _EMPTY_MAPPING
+    _by_name: dict[str, ProviderConfig] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Keep the first entry for duplicate names, matching a linear scan
+        by_name: dict[str, ProviderConfig] = {}
+        for provider in self.providers:
+            by_name.setdefault(provider.name, provider)
+        object.__setattr__(self, "_by_name", by_name)
 
     @classmethod
     def load(cls, config_path: str | Path | None = None) -> UseEnvConfig:
@@ -54,16 +95,20 @@ class UseEnvConfig:
     @classmethod
     def _find_config_file(cls) -> str | None:
         """Search for config file in standard locations."""
-        search_paths = [
-            Path.cwd() / ".use-env.yaml",
-            Path.cwd() / ".use-env.yml",
-            Path.cwd() / "use-env.yaml",
-            Path.cwd() / "use-env.yml",
-            Path.home() / ".config" / "use-env.yaml",
-            Path.home() / ".use-env.yaml",
-        ]
+        cwd = Path.cwd()
 
-        for path in search_paths:
+        # One directory listing instead of a stat per candidate name
+        try:
+            with os.scandir(cwd) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+
+        for name in _CWD_CONFIG_NAMES:
+            if name in present:
+                return str(cwd / name)
+
+        for path in _home_config_paths():
             if path.exists():
                 return str(path)
 
@@ -71,43 +116,55 @@ class UseEnvConfig:
 
     @classmethod
     def _parse_config_file(cls, config_path: str | Path) -> UseEnvConfig:
-        """Parse a YAML configuration file."""
+        """Parse a YAML configuration file, reusing the result while it is unchanged."""
         path = Path(config_path)
+        cache_key = os.path.abspath(path)
+        st = path.stat()
+
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
 
+        config = cls._build_config(path)
+        _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
+        return config
+
+    @classmethod
+    def _build_config(cls, path: Path) -> UseEnvConfig:
+        """Read and parse a YAML configuration file."""
         try:
-            data = yaml.safe_load(path.read_text())
+            data = yaml.load(path.read_text(), Loader=_YamlLoader)
         except yaml.YAMLError as exc:
             raise ConfigurationError(f"Invalid YAML in config file: {exc}") from exc
 
         if data is None:
             return cls()
 
-        providers = []
-        for provider_data in data.get("providers", []):
-            provider = ProviderConfig(
+        providers = [
+            ProviderConfig(
                 name=provider_data.get("name", ""),
                 type=provider_data.get("type", ""),
                 enabled=provider_data.get("enabled", True),
-                config=provider_data.get("config", {}),
+                config=provider_data.get("config") or _EMPTY_MAPPING,
             )
-            providers.append(provider)
+            for provider_data in data.get("providers", ())
+        ]
 
         return cls(
             providers=providers,
-            global_options=data.get("options", {}),
+            global_options=data.get("options") or _EMPTY_MAPPING,
         )
 
     def get_provider_config(self, provider_name: str) -> ProviderConfig | None:
         """Get configuration for a specific provider."""
-        for provider in self.providers:
-            if provider.name == provider_name:
-                return provider
-        return None
+        return self._by_name.get(provider_name)
 
 
 class ConfigurationError(Exception):
     """Exception raised for configuration errors."""
 
+    __slots__ = ("message", "from_exception")
+
     def __init__(self, message: str, from_exception: Exception | None = None) -> None:
         self.message = message
         self.from_exception = from_exception
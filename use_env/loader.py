@@ -8,16 +8,21 @@ and resolving them using registered providers.
 from __future__ import annotations
 
 import asyncio
+import locale
+import mmap
+import os
 import re
+import sys
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TextIO
 
-from .config import UseEnvConfig
-from .providers import Provider, ProviderError, ProviderRegistry
+from .config import ProviderConfig, UseEnvConfig
+from .providers import Provider, ProviderError, ProviderRegistry, lend_http_session
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EnvVariable:
     """Represents a single environment variable from an env file."""
 
@@ -27,7 +32,7 @@ class EnvVariable:
     raw_value: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecretReference:
     """Represents a secret reference in an environment file."""
 
@@ -63,6 +68,39 @@ class EnvLoader:
         """Initialize the env loader."""
         self.config = config or UseEnvConfig()
         self._providers: dict[str, Provider] = {}
+        # Configured providers not instantiated yet; built on first reference
+        self._pending: dict[str, ProviderConfig] = {}
+        self._http_session: Any | None = None
+        self._reference_pattern = self.REFERENCE_PATTERN
+        self.refresh_providers()
+
+    def refresh_providers(self) -> None:
+        """
+        Snapshot the provider registry and rebuild the reference pattern.
+
+        The loader only sees providers that were registered when it was
+        constructed or when this was last called; providers registered later
+        are ignored until ``refresh_providers`` is called again.
+
+        Only ``${name:...}`` tokens whose name is in the snapshot (or
+        configured on this loader) are treated as secret references, so other
+        ``${...}`` syntax such as shell defaults is left untouched.
+        """
+        self._registry = ProviderRegistry.snapshot()
+        self._compile_reference_pattern()
+
+    def _compile_reference_pattern(self) -> None:
+        """Build the reference pattern from the snapshot and configured names."""
+        names = self._registry.keys() | self._providers.keys() | self._pending.keys()
+        if not names:
+            # Nothing can be resolved; match nothing
+            self._reference_pattern = re.compile(r"(?!)")
+            return
+
+        alternation = "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+        self._reference_pattern = re.compile(
+            r"\$\{(?P<provider>" + alternation + r"):(?P<reference>[^}]+)\}"
+        )
 
     async def load(
         self,
@@ -70,6 +108,7 @@ class EnvLoader:
         output_path: str | Path | None = None,
         strict: bool = True,
         stdin_content: str | None = None,
+        stdin_stream: TextIO | None = None,
     ) -> LoadResult:
         """
         Load an environment file and resolve all secret references.
@@ -79,6 +118,9 @@ class EnvLoader:
             output_path: Optional path for the output .env file, or "-" for stdout
             strict: If True, raise on any resolution errors
             stdin_content: Content from stdin (for piped input)
+            stdin_stream: A text stream to read piped input from, such as
+                ``sys.stdin``. It is read in full, since the output is a
+                rewrite of the whole input.
 
         Returns:
             A LoadResult containing the resolved content and metadata
@@ -90,6 +132,9 @@ class EnvLoader:
             input_path = Path(input_path)
 
         # Determine content source
+        if stdin_content is None and stdin_stream is not None:
+            stdin_content = stdin_stream.read()
+
         if stdin_content is not None:
             # Piped input
             content = stdin_content
@@ -98,7 +143,7 @@ class EnvLoader:
             if not input_path.exists():
                 raise EnvFileError(f"Input file not found: {input_path}")
 
-            content = input_path.read_text()
+            content = _read_input(input_path)
             effective_input_path = input_path
         else:
             raise EnvFileError("Either input_path or stdin_content must be provided")
@@ -114,16 +159,22 @@ class EnvLoader:
         else:
             final_output_path = Path(output_path)
 
-        lines = content.splitlines()
-        variables = self._parse_lines(lines)
-
-        references = self._find_references(content, variables)
-
         await self._initialize_providers()
 
-        resolved_values, errors = await self._resolve_all_references(references, strict)
+        variables, references = self._parse_lines(_iter_lines(content))
 
-        resolved_content = self._replace_references(content, resolved_values)
+        if strict:
+            unknown = self._unknown_providers(variables)
+            if unknown:
+                raise EnvFileError(f"Unknown provider(s): {', '.join(unknown)}")
+
+        if references:
+            resolved_values, errors = await self._resolve_all_references(references, strict)
+            resolved_content = self._render_references(content, references, resolved_values)
+        else:
+            # Already-resolved files are common; pass them through untouched
+            resolved_values, errors = {}, []
+            resolved_content = content
 
         # Write output
         if output_to_stdout:
@@ -141,70 +192,118 @@ class EnvLoader:
             errors=errors,
         )
 
-    def _parse_lines(self, lines: list[str]) -> list[EnvVariable]:
-        """Parse lines into EnvVariable objects."""
-        variables = []
+    def _parse_lines(self, lines: Iterable[str]) -> tuple[list[EnvVariable], list[SecretReference]]:
+        """Parse lines into EnvVariable objects and the secret references they contain.
+
+        Variables and references are extracted in a single pass, so ``lines``
+        may be any iterable, such as a file object or ``_iter_lines``. Reference
+        positions are offsets into the content the lines came from; pass lines
+        with their line endings for exact offsets.
+        """
+        variables: list[EnvVariable] = []
+        references: list[SecretReference] = []
+        line_offset = 0
+
+        # Bind hot lookups once; this loop runs for every line of the file
+        add_variable = variables.append
+        add_reference = references.append
+        find_references = self._reference_pattern.finditer
+
+        for line_num, raw_line in enumerate(lines, 1):
+            line = raw_line.rstrip("\r\n")
+            line_start = line_offset
+            # Lines given without endings are assumed to have been split on "\n"
+            line_offset += len(raw_line) if raw_line != line else len(raw_line) + 1
 
-        for line_num, line in enumerate(lines, 1):
             stripped_line = line.strip()
 
-            if not stripped_line or stripped_line.startswith("#"):
+            if not stripped_line or stripped_line[0] == "#":
                 continue
 
-            if "=" not in stripped_line:
+            key, sep, raw_value = stripped_line.partition("=")
+            if not sep:
                 continue
 
-            key, raw_value = stripped_line.split("=", 1)
+            value_start = len(line) - len(line.lstrip()) + len(key) + 1
+            value_start += len(raw_value) - len(raw_value.lstrip())
             key = key.strip()
             raw_value = raw_value.strip()
 
-            if (raw_value.startswith('"') and raw_value.endswith('"')) or (
-                raw_value.startswith("'") and raw_value.endswith("'")
-            ):
+            quote = raw_value[:1]
+            if quote in ('"', "'") and raw_value[-1:] == quote:
                 raw_value = raw_value[1:-1]
+                value_start += 1
 
-            variables.append(
-                EnvVariable(
-                    key=key,
-                    value=raw_value,
-                    line_number=line_num,
-                    raw_value=line,
-                )
-            )
-
-        return variables
+            add_variable(EnvVariable(key, raw_value, line_num, line))
 
-    def _find_references(self, content: str, variables: list[EnvVariable]) -> list[SecretReference]:
-        """Find all secret references in the content."""
-        references = []
-
-        for var in variables:
-            matches = self.REFERENCE_PATTERN.finditer(var.value)
+            # Most values are plain; only run the regex when a reference can appear
+            if "${" not in raw_value:
+                continue
 
-            for match in matches:
-                references.append(
+            value_offset = line_start + value_start
+            for match in find_references(raw_value):
+                # The pattern's only groups are (provider, reference)
+                provider_name, reference = match.groups()
+                # Interned so grouping by provider compares by identity
+                provider_name = sys.intern(provider_name)
+                start, end = match.span()
+                add_reference(
                     SecretReference(
-                        provider_name=match.group("provider"),
-                        reference=match.group("reference"),
-                        key=var.key,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
+                        provider_name, reference, key, value_offset + start, value_offset + end
                     )
                 )
 
-        return references
+        return variables, references
+
+    def _unknown_providers(self, variables: Iterable[EnvVariable]) -> list[str]:
+        """Return the sorted names of ``${name:...}`` tokens naming no known provider.
+
+        The reference pattern only matches known names, so strict mode scans
+        values again with the generic ``REFERENCE_PATTERN`` to catch typos.
+        Shell expansions such as ``${HOME:-/root}`` are not counted.
+        """
+        known = self._registry.keys() | self._providers.keys() | self._pending.keys()
+        unknown: set[str] = set()
+        for variable in variables:
+            if "${" not in variable.value:
+                continue
+            for name, reference in self.REFERENCE_PATTERN.findall(variable.value):
+                if name not in known and reference[0] not in "-=?+":
+                    unknown.add(name)
+        return sorted(unknown)
 
     async def _initialize_providers(self) -> None:
-        """Initialize all configured providers."""
-        # Register providers from config
+        """Record the configured providers.
+
+        Instances are only created when a reference first needs them, so
+        providers the file never uses cost nothing.
+        """
         for provider_config in self.config.providers:
-            if provider_config.enabled:
-                self._register_provider(provider_config)
+            if provider_config.enabled and provider_config.name not in self._providers:
+                self._pending[provider_config.name] = provider_config
+
+        self._compile_reference_pattern()
 
-    def _register_provider(self, config: Any) -> None:
-        """Register a provider from configuration."""
-        instance = ProviderRegistry.get(config.type, config.config)
+    def _register_provider(self, config: ProviderConfig) -> Provider:
+        """Instantiate a provider from configuration."""
+        instance = self._instantiate(config.type, config.config)
         self._providers[config.name] = instance
+        return instance
+
+    def _instantiate(self, provider_type: str, config: Mapping[str, Any] | None = None) -> Provider:
+        """Get a registry instance of a provider class from this loader's snapshot.
+
+        Raises:
+            ProviderError: If the snapshot has no provider of that type
+        """
+        provider_class = self._registry.get(provider_type)
+        if provider_class is None:
+            available = ", ".join(self._registry)
+            raise ProviderError(
+                f"Provider '{provider_type}' not found. Available providers: {available}",
+                provider=provider_type,
+            )
+        return ProviderRegistry.get(provider_type, config, provider_class)
 
     async def _resolve_all_references(
         self,
@@ -213,6 +312,9 @@ class EnvLoader:
     ) -> tuple[dict[str, str], list[ResolutionError]]:
         """Resolve all secret references, using concurrency where possible.
 
+        References are grouped by provider so providers that override
+        ``resolve_batch`` can coalesce fetches; groups run concurrently.
+
         This method keeps the existing error semantics:
         - In strict mode, the first resolution failure raises EnvFileError.
         - In non-strict mode, errors are collected and returned.
@@ -223,12 +325,45 @@ class EnvLoader:
         if not references:
             return resolved_values, errors
 
-        # Launch all resolutions concurrently
-        tasks = [self._resolve_reference(ref) for ref in references]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        groups: dict[str, list[SecretReference]] = {}
+        for ref in references:
+            groups.setdefault(ref.provider_name, []).append(ref)
+
+        # Look up each provider once per load rather than once per reference.
+        # A lookup failure (e.g. a configured type that isn't registered) is
+        # reported for each of that provider's references.
+        providers: dict[str, Provider] = {}
+        lookup_errors: dict[str, ProviderError] = {}
+        for name in groups:
+            try:
+                providers[name] = self._get_provider(name)
+            except ProviderError as exc:
+                lookup_errors[name] = exc
+
+        # HTTP providers may be shared with other loaders, so the session is
+        # lent for these resolve calls rather than stored on the provider
+        uses_http = any(provider.uses_http for provider in providers.values())
+        session = self._get_http_session() if uses_http else None
+
+        # Optionally bound how many single-reference resolutions run at once
+        max_concurrency = self.config.global_options.get("max_concurrency")
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        with lend_http_session(session):
+            group_results = await asyncio.gather(
+                *(
+                    self._resolve_provider_group(providers[name], refs, semaphore)
+                    for name, refs in groups.items()
+                    if name in providers
+                )
+            )
+        outcomes: dict[str, dict[str, str | BaseException]] = dict(zip(providers, group_results))
+        for name, exc in lookup_errors.items():
+            outcomes[name] = {ref.reference: exc for ref in groups[name]}
 
-        for ref, result in zip(references, results):
-            if isinstance(result, Exception):
+        for ref in references:
+            result = outcomes[ref.provider_name][ref.reference]
+            if isinstance(result, BaseException):
                 # Normalize to ProviderError when possible
                 exc = result
                 message = str(exc)
@@ -246,23 +381,105 @@ class EnvLoader:
                 errors.append(error)
                 continue
 
-            value = cast(str, result)
-            resolved_values[f"{ref.provider_name}://{ref.reference}"] = value
+            resolved_values[f"{ref.provider_name}://{ref.reference}"] = result
 
         return resolved_values, errors
 
-    async def _resolve_reference(self, reference: SecretReference) -> str:
-        """Resolve a single secret reference."""
-        if reference.provider_name not in self._providers:
-            if not ProviderRegistry.is_registered(reference.provider_name):
-                raise ProviderError(
-                    f"Unknown provider: {reference.provider_name}",
-                    reference=reference.reference,
-                )
-            self._providers[reference.provider_name] = ProviderRegistry.get(reference.provider_name)
+    async def _resolve_provider_group(
+        self,
+        provider: Provider,
+        references: list[SecretReference],
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> dict[str, str | BaseException]:
+        """Resolve all references for one provider, keyed by reference.
+
+        Providers that override ``resolve_batch`` receive every valid reference
+        in one call. Anything the batch does not return (or every reference, if
+        the batch raises) is resolved individually so errors stay attributed to
+        the reference that caused them. Each distinct reference is resolved
+        once however many variables use it, and references the provider has
+        cached (``Provider.cached_value``) are not resolved again.
+        """
+        outcomes: dict[str, str | BaseException] = {}
+        unique = {ref.reference: ref for ref in references}
+
+        # Values the provider already holds are taken without a coroutine
+        cached_value = provider.cached_value
+        for reference in unique:
+            value = cached_value(reference)
+            if value is not None:
+                outcomes[reference] = value
+
+        if type(provider).resolve_batch is not Provider.resolve_batch:
+            batch = [
+                reference
+                for reference in unique
+                if reference not in outcomes and provider.validate_reference(reference)
+            ]
+            try:
+                values = await provider.resolve_batch(batch) if batch else {}
+            except Exception:
+                values = {}
+
+            for reference in unique:
+                if reference in values:
+                    outcomes[reference] = values[reference]
+
+        remaining = [ref for reference, ref in unique.items() if reference not in outcomes]
+        results = await asyncio.gather(
+            *(self._resolve_bounded(provider, ref, semaphore) for ref in remaining),
+            return_exceptions=True,
+        )
+        for ref, result in zip(remaining, results):
+            outcomes[ref.reference] = result
+
+        return outcomes
+
+    def _get_http_session(self) -> Any | None:
+        """Get the aiohttp session shared by HTTP providers, creating it on first use.
+
+        Returns None when aiohttp is not installed; providers then report
+        the missing extra themselves.
+        """
+        if self._http_session is None:
+            try:
+                import aiohttp
+            except ImportError:
+                return None
+
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+        return self._http_session
+
+    def _get_provider(self, provider_name: str) -> Provider:
+        """Get the provider instance used by this loader, creating it if needed."""
+        provider = self._providers.get(provider_name)
+        if provider is not None:
+            return provider
+
+        config = self._pending.pop(provider_name, None)
+        if config is not None:
+            return self._register_provider(config)
 
-        provider = self._providers[reference.provider_name]
+        provider = self._providers[provider_name] = self._instantiate(provider_name)
+        return provider
 
+    async def _resolve_bounded(
+        self,
+        provider: Provider,
+        reference: SecretReference,
+        semaphore: asyncio.Semaphore | None,
+    ) -> str:
+        """Resolve a single reference, holding the semaphore if one is given."""
+        if semaphore is None:
+            return await self._resolve_reference(provider, reference)
+
+        async with semaphore:
+            return await self._resolve_reference(provider, reference)
+
+    async def _resolve_reference(self, provider: Provider, reference: SecretReference) -> str:
+        """Resolve a single secret reference with an already looked-up provider."""
         if not provider.validate_reference(reference.reference):
             raise ProviderError(
                 f"Invalid reference format for provider '{reference.provider_name}': {reference.reference}",
@@ -272,25 +489,98 @@ class EnvLoader:
 
         return await provider.resolve(reference.reference)
 
+    @staticmethod
+    def _render_references(
+        content: str, references: list[SecretReference], resolved_values: dict[str, str]
+    ) -> str:
+        """Substitute resolved values at the spans recorded while parsing.
+
+        ``references`` must be in content order, as ``_parse_lines`` returns
+        them. Unresolved references are left as written.
+        """
+        if not resolved_values:
+            return content
+
+        pieces: list[str] = []
+        add_piece = pieces.append
+        last = 0
+
+        for ref in references:
+            value = resolved_values.get(f"{ref.provider_name}://{ref.reference}")
+            if value is None:
+                continue
+            add_piece(content[last : ref.start_pos])
+            add_piece(value)
+            last = ref.end_pos
+
+        if not pieces:
+            return content
+
+        add_piece(content[last:])
+        return "".join(pieces)
+
     def _replace_references(self, content: str, resolved_values: dict[str, str]) -> str:
         """Replace all secret references with their resolved values."""
+        if not resolved_values:
+            return content
 
         def replace_match(match: re.Match) -> str:
-            provider = match.group("provider")
-            reference = match.group("reference")
-            key = f"{provider}://{reference}"
+            provider, reference = match.group("provider", "reference")
 
-            return resolved_values.get(key, match.group(0))
+            return resolved_values.get(f"{provider}://{reference}", match.group(0))
 
-        return self.REFERENCE_PATTERN.sub(replace_match, content)
+        return self._reference_pattern.sub(replace_match, content)
 
     async def close(self) -> None:
-        """Clean up all providers."""
-        for provider in self._providers.values():
-            await provider.close()
+        """Release the loader's shared HTTP session.
+
+        Provider instances come from ``ProviderRegistry`` and may be shared
+        with other loaders, so they are left open; close them with
+        ``ProviderRegistry.aclose()`` once no loader needs them.
+        """
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+
+# Files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_input(path: Path) -> str:
+    """Read an input file as text.
+
+    Large files are decoded directly from a read-only memory map, which skips
+    the intermediate bytes copy ``read_text`` makes. Files containing ``\r``
+    still go through ``read_text`` so newline translation is unchanged.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\r") == -1:
+                    return str(mm, locale.getpreferredencoding(False))
+
+    return path.read_text()
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield the lines of content with their endings, one at a time.
+
+    Unlike ``str.splitlines``, this never holds a list of every line in memory.
+    """
+    start = 0
+    length = len(content)
+    while start < length:
+        end = content.find("\n", start)
+        if end == -1:
+            end = length
+        else:
+            end += 1
+        yield content[start:end]
+        start = end
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoadResult:
     """Result of loading an environment file."""
 
@@ -302,7 +592,7 @@ class LoadResult:
     errors: list[ResolutionError]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolutionError:
     """Error that occurred during resolution."""
 
@@ -25,13 +25,44 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a reference pattern once per distinct pattern string."""
+    return re.compile(pattern)
+
+
+# The aiohttp session lent by the EnvLoader resolving in the current context.
+# Provider instances are shared between loaders, so the session is scoped to
+# the loader's resolve calls instead of being stored on the provider.
+_LENT_HTTP_SESSION: ContextVar[Any] = ContextVar("use_env_http_session", default=None)
+
+
+@contextmanager
+def lend_http_session(session: Any) -> Iterator[None]:
+    """Make session the HTTP session of providers resolving in this context."""
+    token = _LENT_HTTP_SESSION.set(session)
+    try:
+        yield
+    finally:
+        _LENT_HTTP_SESSION.reset(token)
+
+
+@dataclass(slots=True)
 class ProviderInfo:
     """Metadata about a provider."""
 
@@ -43,7 +74,7 @@ class ProviderInfo:
     help: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     """Result of resolving a secret reference."""
 
@@ -53,6 +84,86 @@ class ResolutionResult:
     cache_hit: bool = False
 
 
+class TTLCache:
+    """
+    Bounded cache of resolved values for providers.
+
+    Entries expire ``ttl`` seconds after they are stored (never when ttl is
+    None), and once ``maxsize`` entries are held the least recently used one
+    is evicted. A ttl or maxsize of 0 disables caching.
+    """
+
+    DEFAULT_MAXSIZE = 1024
+    DEFAULT_TTL = 300.0
+
+    __slots__ = ("maxsize", "ttl", "_data")
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = DEFAULT_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry on the monotonic clock or None, value)
+        self._data: OrderedDict[Any, tuple[float | None, Any]] = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> TTLCache:
+        """Build a cache from the ``cache_maxsize`` and ``cache_ttl`` config options."""
+        maxsize = int(config.get("cache_maxsize", cls.DEFAULT_MAXSIZE))
+        ttl = config.get("cache_ttl", cls.DEFAULT_TTL)
+        return cls(maxsize, None if ttl is None else float(ttl))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the live value for key, or default."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires, value = entry
+        if expires is not None and time.monotonic() >= expires:
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set(key, value)
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        """Store value for key.
+
+        A ttl here, such as a server's max-age, can only shorten the cache's
+        own ttl; 0 skips storing the value.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        elif self.ttl is not None:
+            ttl = min(ttl, self.ttl)
+        if self.maxsize <= 0 or ttl == 0:
+            return
+
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+
+_MISSING = object()
+
+# Tags the _coalesce keys used by the default resolve_batch
+_BATCH_KEY = object()
+
+
 class Provider(ABC):
     """
     Base class for all secret providers.
@@ -81,6 +192,41 @@ class Provider(ABC):
     """
 
     info: ProviderInfo
+    _resolve_futures: dict[str, asyncio.Future[str]]
+    _inflight: dict[Hashable, asyncio.Future[Any]]
+
+    # Providers that talk HTTP through aiohttp set uses_http; EnvLoader then
+    # lends them its ClientSession for connection reuse (see
+    # lent_http_session). Setting http_session pins a session instead.
+    uses_http: bool = False
+    http_session: Any = None
+
+    # Default cap on concurrent lookups in resolve_batch; the batch_concurrency
+    # config option sets it per instance
+    batch_concurrency: int = 16
+
+    # info.reference_pattern compiled when the subclass is defined; None when
+    # the class has no pattern (or no class-level info)
+    _compiled_pattern: re.Pattern[str] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        info = cls.__dict__.get("info")
+        if not isinstance(info, ProviderInfo):
+            return
+
+        pattern = info.reference_pattern
+        cls._compiled_pattern = _compile_pattern(pattern) if pattern else None
+
+        # Subclasses that keep the default validate_reference get a copy bound
+        # to their own compiled pattern, skipping the per-call info lookups
+        for klass in cls.__mro__:
+            method = klass.__dict__.get("validate_reference")
+            if method is not None:
+                break
+        if klass is Provider or getattr(method, "_specialized", False):
+            cls.validate_reference = _specialize_validator(cls._compiled_pattern)
 
     @abstractmethod
     async def resolve(self, reference: str) -> str:
@@ -108,48 +254,232 @@ class Provider(ABC):
         Returns:
             True if the reference is valid, False otherwise
 
-        The default implementation uses the info.reference_pattern if provided.
-        Override this method for custom validation logic.
+        The default implementation uses the info.reference_pattern if provided,
+        compiling each distinct pattern once. Subclasses that keep this default
+        get a version specialized to their class-level pattern when they are
+        defined. Override this method for custom validation logic.
         """
-        if not self.info.reference_pattern:
+        pattern = self.info.reference_pattern
+        if not pattern:
             return True
 
-        return bool(re.match(self.info.reference_pattern, reference))
+        return _compile_pattern(pattern).match(reference) is not None
+
+    def lent_http_session(self) -> Any:
+        """Return http_session, or the session lent by the loader resolving now.
+
+        None when neither is set; the provider then uses a session of its own.
+        """
+        if self.http_session is not None:
+            return self.http_session
+        return _LENT_HTTP_SESSION.get()
+
+    def cached_value(self, reference: str) -> str | None:
+        """
+        Return an already resolved value without awaiting, or None.
+
+        Callers try this before ``resolve`` so cache hits cost no coroutine.
+        The default returns values completed through ``resolve_cached``;
+        providers with their own cache override it to consult that cache.
+
+        Args:
+            reference: The reference string to look up
+
+        Returns:
+            The cached value, or None if the reference must be resolved
+        """
+        try:
+            future = self._resolve_futures.get(reference)
+        except AttributeError:
+            return None
+
+        if future is None or not future.done() or future.cancelled() or future.exception():
+            return None
+        return future.result()
+
+    async def resolve_cached(self, reference: str) -> str:
+        """
+        Resolve a reference, reusing earlier and in-flight lookups.
+
+        Concurrent and repeated calls for the same reference share a single
+        ``resolve`` call. Successful values are kept for the life of the
+        instance; failures are not, so a later call tries again.
+
+        Args:
+            reference: The reference string to resolve
+
+        Returns:
+            The resolved secret value
+        """
+        try:
+            futures = self._resolve_futures
+        except AttributeError:
+            futures = self._resolve_futures = {}
+
+        future = futures.get(reference)
+        if future is not None:
+            # Shield so a cancelled waiter does not cancel the shared lookup
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        futures[reference] = future
+        try:
+            value = await self.resolve(reference)
+        except asyncio.CancelledError:
+            del futures[reference]
+            future.cancel()
+            raise
+        except Exception as e:
+            del futures[reference]
+            future.set_exception(e)
+            # The exception is raised here; don't warn if nobody else awaited it
+            future.exception()
+            raise
+
+        future.set_result(value)
+        return value
+
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fetch`` for key, sharing the call with concurrent callers.
+
+        While a fetch for key is in flight, other callers await its outcome
+        instead of starting their own. Nothing is kept once it completes, so
+        caching stays with the provider.
+        """
+        try:
+            inflight = self._inflight
+        except AttributeError:
+            inflight = self._inflight = {}
+
+        future = inflight.get(key)
+        if future is not None:
+            # Shield so a cancelled waiter does not cancel the shared fetch
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # The exception is raised here; don't warn if nobody else awaited it
+            future.exception()
+            raise
+        finally:
+            del inflight[key]
+
+        future.set_result(value)
+        return value
 
     async def resolve_batch(
-        self, references: list[str], progress_callback: Any | None = None
+        self,
+        references: list[str],
+        progress_callback: Any | None = None,
+        max_concurrency: int | None = None,
     ) -> dict[str, str]:
         """
         Resolve multiple references efficiently.
 
-        Override this method to implement batch resolution for providers
-        that support it (e.g., API-based providers).
+        The default implementation starts every lookup up front and calls
+        ``resolve`` once per distinct reference, so duplicates share one call.
+        Nothing is kept after the batch; caching stays with ``resolve``.
+        Override this method to implement batch resolution for providers that
+        support it (e.g., API-based providers).
 
         Args:
             references: List of references to resolve
             progress_callback: Optional callback(reference, index, total) for progress
+            max_concurrency: Optional cap on concurrent resolve calls, for
+                rate-limited backends (default: ``batch_concurrency``)
 
         Returns:
             Dictionary mapping references to resolved values
         """
-        results: dict[str, str] = {}
+        total = len(references)
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
 
-        for i, ref in enumerate(references):
+        async def bounded(reference: str) -> str:
+            async with semaphore:
+                return await self.resolve(reference)
+
+        async def resolve_one(index: int, reference: str) -> str:
             if progress_callback:
-                progress_callback(ref, i, len(references))
+                progress_callback(reference, index, total)
+            # Coalesced outside the semaphore so a queued duplicate joins the
+            # first lookup instead of waiting for a slot of its own. The key is
+            # tagged so it can't collide with keys resolve() coalesces on.
+            return await self._coalesce((_BATCH_KEY, reference), lambda: bounded(reference))
+
+        values = await asyncio.gather(*(resolve_one(i, ref) for i, ref in enumerate(references)))
+        return dict(zip(references, values))
+
+    async def warm(self, references: Iterable[str]) -> None:
+        """
+        Resolve references ahead of time so later lookups are cache hits.
+
+        The distinct references go through ``resolve_batch`` and the values
+        are discarded. If the batch fails, references without a cached value
+        are resolved individually, as ``EnvLoader`` does, so the rest still
+        finish warming. Errors are ignored here; they are raised again when
+        the reference is resolved for real. Providers that don't override
+        ``cached_value`` have no cache for a batch to fill, so they warm
+        ``resolve_cached`` instead.
+
+        ``EnvLoader`` already resolves a file's references in one batch per
+        provider, so this is for callers that resolve references one at a
+        time later.
+
+        Args:
+            references: References to resolve, duplicates allowed
+        """
+        unique = list(dict.fromkeys(references))
+        if not unique:
+            return
+        if type(self).cached_value is Provider.cached_value:
+            # Without a cache of its own, only resolve_cached keeps the values
+            await asyncio.gather(
+                *(self.resolve_cached(reference) for reference in unique),
+                return_exceptions=True,
+            )
+            return
+        try:
+            await self.resolve_batch(unique)
+        except Exception:
+            await asyncio.gather(
+                *(
+                    self.resolve_cached(reference)
+                    for reference in unique
+                    if self.cached_value(reference) is None
+                ),
+                return_exceptions=True,
+            )
+
+    def configure(self, config: dict[str, Any]) -> None:
+        """
+        Apply options from the provider's config.
 
-            results[ref] = await self.resolve(ref)
+        The base handles ``batch_concurrency``. Override this method to read
+        provider-specific options, and call ``super().configure(config)``.
 
-        return results
+        Args:
+            config: The provider's config mapping
+        """
+        if "batch_concurrency" in config:
+            self.batch_concurrency = int(config["batch_concurrency"])
 
     async def close(self) -> None:
         """
         Cleanup resources when the provider is no longer needed.
 
-        Override this method to implement cleanup logic such as
-        closing network connections or releasing resources.
+        The default drops values memoized by ``resolve_cached``. Override
+        this method to implement cleanup logic such as closing network
+        connections or releasing resources, and call ``super().close()``.
         """
-        pass
+        self._resolve_futures = {}
 
     async def __aenter__(self) -> Provider:
         """Async context manager entry."""
@@ -160,6 +490,46 @@ class Provider(ABC):
         await self.close()
 
 
+def _specialize_validator(pattern: re.Pattern[str] | None) -> Callable[[Provider, str], bool]:
+    """Build a validate_reference for a fixed compiled reference pattern."""
+    if pattern is None:
+
+        def validate_reference(self: Provider, reference: str) -> bool:
+            return True
+
+    else:
+        match = pattern.match
+
+        def validate_reference(self: Provider, reference: str) -> bool:
+            return match(reference) is not None
+
+    validate_reference.__doc__ = Provider.validate_reference.__doc__
+    validate_reference._specialized = True  # type: ignore[attr-defined]
+    return validate_reference
+
+
+def _config_key(config: Mapping[str, Any]) -> str:
+    """Serialize a provider config into a stable, hashable cache key."""
+    return json.dumps(dict(config), sort_keys=True, default=str)
+
+
+# SDK clients shared by every provider instance in the process, so credential
+# and connection setup happens once; keys start with the provider's name
+_CLIENTS: dict[Hashable, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def shared_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the process-wide client for key, building it with factory on first use."""
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = _CLIENTS[key] = factory()
+    return client
+
+
 class ProviderRegistry:
     """
     Registry for discovering and managing secret providers.
@@ -169,21 +539,28 @@ class ProviderRegistry:
     """
 
     _providers: dict[str, type[Provider]] = {}
-    _instances: dict[str, Provider] = {}
-    _config: dict[str, dict[str, Any]] = {}
+    # Keyed by (name, canonical config JSON); None stands for no config
+    _instances: dict[tuple[str, str | None], Provider] = {}
+    _config: dict[str, Mapping[str, Any]] = {}
+    # Rebuilt on demand after register() or clear()
+    _info_cache: tuple[ProviderInfo, ...] | None = None
 
     @classmethod
-    def register(cls, provider_class: type[Provider], name: str | None = None) -> None:
+    def register(
+        cls, provider_class: type[Provider], name: str | None = None, exist_ok: bool = False
+    ) -> None:
         """
         Register a provider class with the registry.
 
         Args:
             provider_class: The provider class to register
             name: Optional custom name, defaults to provider.info.name
+            exist_ok: Keep an existing registration under the name instead of raising
 
         Raises:
             ValueError: If provider class is missing required attributes
-            KeyError: If a provider with the same name is already registered
+            KeyError: If a provider with the same name is already registered and
+                exist_ok is false
         """
         if not hasattr(provider_class, "info") or not isinstance(provider_class.info, ProviderInfo):
             raise ValueError(
@@ -193,52 +570,91 @@ class ProviderRegistry:
         provider_name = name or provider_class.info.name
 
         if provider_name in cls._providers:
+            if exist_ok:
+                return
             raise KeyError(f"Provider '{provider_name}' is already registered")
 
         cls._providers[provider_name] = provider_class
+        cls._info_cache = None
 
     @classmethod
-    def get(cls, name: str, config: dict[str, Any] | None = None) -> Provider:
+    def get(
+        cls,
+        name: str,
+        config: Mapping[str, Any] | None = None,
+        provider_class: type[Provider] | None = None,
+    ) -> Provider:
         """
         Get an instance of a provider by name.
 
+        Instances are cached per name and configuration, so repeated calls
+        with an equal config return the same configured instance.
+
         Args:
             name: The name of the provider to get
             config: Optional configuration for the provider instance
+            provider_class: The class to instantiate instead of the one
+                registered under name, such as an entry from ``snapshot()``
 
         Returns:
             An instance of the requested provider
 
         Raises:
-            KeyError: If no provider with the given name is registered
+            KeyError: If no provider class is given and none is registered under name
         """
-        if name not in cls._providers:
-            available = ", ".join(cls._providers.keys())
-            raise KeyError(f"Provider '{name}' not found. Available providers: {available}")
+        if provider_class is None:
+            provider_class = cls._providers.get(name)
+            if provider_class is None:
+                available = ", ".join(cls._providers.keys())
+                raise KeyError(f"Provider '{name}' not found. Available providers: {available}")
 
-        # Cache instances for reuse
-        if name not in cls._instances or config is not None:
-            provider_class = cls._providers[name]
-            instance = provider_class()
+        # Cache instances for reuse; an empty config configures nothing
+        cache_key = (name, _config_key(config) if config else None)
+        instance = cls._instances.get(cache_key)
+        if instance is not None and type(instance) is provider_class:
+            return instance
 
-            if config:
-                cls._config[name] = config
-                if hasattr(instance, "configure"):
-                    instance.configure(config)
+        instance = provider_class()
 
-            cls._instances[name] = instance
+        if config:
+            cls._config[name] = config
+            if hasattr(instance, "configure"):
+                instance.configure(config)
 
-        return cls._instances[name]
+        cls._instances[cache_key] = instance
+        return instance
 
     @classmethod
-    def list_providers(cls) -> list[ProviderInfo]:
+    def list_providers(cls) -> tuple[ProviderInfo, ...]:
         """
         List all registered providers with their metadata.
 
         Returns:
-            List of ProviderInfo objects for all registered providers
+            Tuple of ProviderInfo objects for all registered providers
+        """
+        if cls._info_cache is None:
+            cls._info_cache = tuple(provider.info for provider in cls._providers.values())
+        return cls._info_cache
+
+    @classmethod
+    def list_names(cls) -> list[str]:
+        """
+        List the names providers are registered under.
+
+        Returns:
+            Registered provider names, including custom registration names
+        """
+        return list(cls._providers)
+
+    @classmethod
+    def snapshot(cls) -> dict[str, type[Provider]]:
+        """
+        Copy the current name-to-class mapping.
+
+        Returns:
+            A new dict that later registrations do not affect
         """
-        return [provider.info for provider in cls._providers.values()]
+        return dict(cls._providers)
 
     @classmethod
     def is_registered(cls, name: str) -> bool:
@@ -253,21 +669,36 @@ class ProviderRegistry:
         """
         return name in cls._providers
 
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Close all cached provider instances concurrently and forget them.
+
+        Registrations are kept. Use this from async code; errors raised by
+        individual providers while closing are ignored.
+        """
+        instances = list(cls._instances.values())
+        cls._instances.clear()
+        cls._config.clear()
+        await asyncio.gather(*(instance.close() for instance in instances), return_exceptions=True)
+
     @classmethod
     def clear(cls) -> None:
-        """Clear all registered providers and instances."""
-        for name, instance in cls._instances.items():
-            if hasattr(instance, "close"):
-                import asyncio
+        """
+        Clear all registered providers and instances.
 
-                try:
-                    asyncio.run(instance.close())
-                except Exception:
-                    pass
+        Cached instances are closed in a single event loop. When called from
+        a running loop they cannot be closed here; await ``aclose()`` first.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(cls.aclose())
 
         cls._providers.clear()
         cls._instances.clear()
         cls._config.clear()
+        cls._info_cache = None
 
     @classmethod
     def discover_plugins(cls, entry_point_group: str = "use_env.providers") -> None:
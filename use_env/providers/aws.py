@@ -16,22 +16,103 @@ Install with: pip install use-env[aws]
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
-from typing import Any
+import time
+from contextlib import AsyncExitStack
+from typing import Any, ClassVar
 
-from . import Provider, ProviderError, ProviderInfo
+from . import Provider, ProviderError, ProviderInfo, TTLCache
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# An optional suffix picks how the stored value is read: #raw returns it as is,
+# #json requires a JSON document and #key=<name> extracts one JSON key
+_REFERENCE_PATTERN = r"^(?P<region>[^/]+)/(?P<secret_name>[^#]+)(?:#(?P<flag>raw|json|key=.+))?$"
+_REF_RE = re.compile(_REFERENCE_PATTERN)
+
+# Maximum number of secrets accepted by a single BatchGetSecretValue call
+_BATCH_SIZE = 20
+
+# Connection pool size per client; kept above the default batch_concurrency
+# so concurrent fetches don't queue for a connection
+_MAX_POOL_CONNECTIONS = 32
+
+# Seconds a fetched secret is served from the shared cache before refetching
+_DEFAULT_CACHE_TTL = 300.0
+
+# Seconds past cache_ttl a secret may still be served while refreshes fail
+_DEFAULT_MAX_STALE = 3600.0
+
+# Error codes that may clear up on retry, so a cached value is served meanwhile
+_TRANSIENT_ERROR_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "InternalServiceError",
+        "InternalFailure",
+        "ServiceUnavailable",
+    }
+)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a fetch failed on throttling, a 5xx response or the connection."""
+    if isinstance(exc, ProviderError) and exc.__cause__ is not None:
+        exc = exc.__cause__
+
+    if isinstance(exc, (OSError, asyncio.TimeoutError)):
+        return True
+
+    try:
+        from botocore.exceptions import ClientError, HTTPClientError
+        from botocore.exceptions import ConnectionError as BotoConnectionError
+    except ImportError:
+        return False
+
+    if isinstance(exc, (BotoConnectionError, HTTPClientError)):
+        return True
+    if isinstance(exc, ClientError):
+        code = exc.response.get("Error", {}).get("Code")
+        status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return code in _TRANSIENT_ERROR_CODES or status >= 500
+    return False
 
 
 class AwsSecretsProvider(Provider):
     """
     AWS Secrets Manager provider.
 
-    Resolves secrets from AWS Secrets Manager using boto3.
+    Resolves secrets from AWS Secrets Manager using aiobotocore. One client is
+    kept open per (profile, region) for the lifetime of the provider so
+    connections are reused across secrets.
+
+    By default a JSON object secret is reduced to its only value, its
+    ``password`` key or the key named after the secret, and anything else is
+    returned as stored. A ``#raw``, ``#json`` or ``#key=<name>`` suffix on the
+    reference overrides this.
+
+    Fetched secrets are kept in a process-wide cache keyed by (profile,
+    region, secret name) for ``cache_ttl`` seconds, so repeated loads do not
+    refetch them. The cache holds at most ``cache_maxsize`` secrets. When a
+    refresh fails on throttling, a 5xx response or a connection error, the
+    last known value is served for up to ``max_stale`` seconds past its ttl.
 
     Configuration:
         region: AWS region (default: uses default session)
         profile: AWS profile name (optional)
+        batch_concurrency: Maximum concurrent lookups in resolve_batch (default: 16)
+        cache_ttl: Seconds to reuse fetched secrets (default: 300, 0 disables)
+        cache_maxsize: Secrets held in the process-wide cache (default: 1024)
+        max_stale: Seconds past cache_ttl a secret is served while refreshes
+            fail transiently (default: 3600)
 
     Install with: pip install use-env[aws]
     """
@@ -41,13 +122,23 @@ class AwsSecretsProvider(Provider):
         description="AWS Secrets Manager provider",
         version="1.0.0",
         author="use-env contributors",
-        reference_pattern=r"^(?P<region>[^/]+)/(?P<secret_name>.+)$",
+        reference_pattern=_REFERENCE_PATTERN,
     )
 
+    # (profile, region, secret_name) -> (monotonic fetch time, stored value);
+    # shared by all instances and kept across close() so later loads can reuse
+    # it. Values are SecretString (str) or SecretBinary (bytes) as returned.
+    # Entries expire once they are too old to serve even as stale values.
+    _shared_cache: ClassVar[TTLCache] = TTLCache(ttl=None)
+
     def __init__(self) -> None:
         super().__init__()
-        self._session: Any | None = None
-        self._cache: dict[str, str] = {}
+        self._sessions: dict[str | None, Any] = {}
+        self._clients: dict[tuple[str | None, str], Any] = {}
+        self._client_stack = AsyncExitStack()
+        self._client_lock = asyncio.Lock()
+        self._cache_ttl = _DEFAULT_CACHE_TTL
+        self._max_stale = _DEFAULT_MAX_STALE
         self._region: str | None = None
         self._profile: str | None = None
 
@@ -56,7 +147,8 @@ class AwsSecretsProvider(Provider):
         Resolve a secret from AWS Secrets Manager.
 
         Args:
-            reference: Reference in format "region/secret_name" or just "secret_name"
+            reference: Reference in format "region/secret_name", optionally
+                followed by "#raw", "#json" or "#key=<name>"
 
         Returns:
             The secret value
@@ -64,13 +156,8 @@ class AwsSecretsProvider(Provider):
         Raises:
             ProviderError: If resolution fails
         """
-        # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
-
-        # Parse the reference
-        match = re.match(self.info.reference_pattern, reference)
-        if not match:
+        parsed = self._parse_ref(reference)
+        if parsed is None:
             # Try simple format (just secret name, use default region)
             if "/" not in reference:
                 raise ProviderError(
@@ -85,49 +172,203 @@ class AwsSecretsProvider(Provider):
                 reference=reference,
             )
 
-        region = match.group("region")
-        secret_name = match.group("secret_name")
+        return await self._resolve_parsed(reference, *parsed)
+
+    @staticmethod
+    def _parse_ref(reference: str) -> tuple[str, str, str | None] | None:
+        """Split a reference into (region, secret_name, flag), or None if malformed."""
+        match = _REF_RE.match(reference)
+        if match is None:
+            return None
+        region, secret_name, flag = match.groups()
+        return region, secret_name, flag
+
+    async def _resolve_parsed(
+        self, reference: str, region: str, secret_name: str, flag: str | None
+    ) -> str:
+        """Resolve an already parsed reference through the cache."""
+        # Check cache first
+        key = (self._profile, region, secret_name)
+        stored = self._cache_get(key)
+
+        if stored is None:
+            try:
+                stored = await self._fetch_secret(region, secret_name)
+            except Exception as exc:
+                # Serve the last known value rather than failing on a refresh
+                # that may succeed later; a missing or forbidden secret fails
+                stored = self._cache_get(key, allow_stale=True) if _is_transient(exc) else None
+                if stored is None:
+                    raise ProviderError(
+                        f"Failed to fetch secret from AWS Secrets Manager: {exc}",
+                        provider=self.info.name,
+                        reference=reference,
+                    ) from exc
+            else:
+                self._cache_put(key, stored)
 
-        # Fetch the secret
         try:
-            value = await self._fetch_secret(region, secret_name)
-        except Exception as exc:
+            return self._decode_secret(secret_name, stored, flag)
+        except (ValueError, KeyError, TypeError) as exc:
             raise ProviderError(
-                f"Failed to fetch secret from AWS Secrets Manager: {exc}",
+                f"Cannot read secret '{secret_name}' as {flag}: {exc}",
                 provider=self.info.name,
                 reference=reference,
             ) from exc
 
-        # Cache the result
-        self._cache[reference] = value
+    @classmethod
+    def clear_shared_cache(cls) -> None:
+        """Forget every secret in the process-wide cache, for example between tests."""
+        cls._shared_cache.clear()
+
+    def _cache_get(
+        self, key: tuple[str | None, str, str], allow_stale: bool = False
+    ) -> str | bytes | None:
+        """Return a cached secret if present and fresh (or within max_stale with allow_stale)."""
+        entry = self._shared_cache.get(key)
+        if entry is None:
+            return None
+
+        fetched_at, value = entry
+        max_age = self._cache_ttl + self._max_stale if allow_stale else self._cache_ttl
+        if time.monotonic() - fetched_at < max_age:
+            return value
+        return None
+
+    def _cache_put(self, key: tuple[str | None, str, str], value: str | bytes) -> None:
+        """Store a fetched secret unless caching is disabled."""
+        if self._cache_ttl > 0:
+            self._shared_cache.set(
+                key, (time.monotonic(), value), self._cache_ttl + self._max_stale
+            )
+
+    async def resolve_batch(
+        self,
+        references: list[str],
+        progress_callback: Any | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, str]:
+        """
+        Resolve multiple secrets, coalescing fetches per region.
+
+        Uncached references are grouped by region and fetched with
+        BatchGetSecretValue, up to 20 secrets per call, with regions and calls
+        running concurrently. Anything the batch calls do not return falls back
+        to single resolves, run up to ``batch_concurrency`` at a time, which
+        report errors for that reference.
+        """
+        # Parse each reference once; the prefetch and resolves share the result
+        parsed = {reference: self._parse_ref(reference) for reference in references}
+
+        pending: dict[str, dict[str, str]] = {}
+        for reference, parts in parsed.items():
+            if parts is not None:
+                region, secret_name, _ = parts
+                if self._cache_get((self._profile, region, secret_name)) is None:
+                    pending.setdefault(region, {})[secret_name] = reference
+
+        await asyncio.gather(
+            *(self._prefetch_secrets(region, names) for region, names in pending.items())
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
+        total = len(references)
+
+        async def resolve_one(index: int, reference: str) -> str:
+            if progress_callback:
+                progress_callback(reference, index, total)
+
+            parts = parsed[reference]
+            if parts is None:
+                # Raises the usual invalid-reference error
+                return await self.resolve(reference)
+
+            async with semaphore:
+                return await self._resolve_parsed(reference, *parts)
+
+        values = await asyncio.gather(
+            *(resolve_one(i, reference) for i, reference in enumerate(references))
+        )
+        return dict(zip(references, values))
+
+    async def _prefetch_secrets(self, region: str, names: dict[str, str]) -> None:
+        """Populate the cache for secret names in one region using batch calls."""
+        try:
+            client = await self._get_client(region, f"{region}/*")
+        except ProviderError:
+            return
+
+        secret_ids = list(names)
+        await asyncio.gather(
+            *(
+                self._prefetch_chunk(client, region, secret_ids[start : start + _BATCH_SIZE], names)
+                for start in range(0, len(secret_ids), _BATCH_SIZE)
+            )
+        )
 
-        return value
+    async def _prefetch_chunk(
+        self, client: Any, region: str, chunk: list[str], names: dict[str, str]
+    ) -> None:
+        """Fetch one BatchGetSecretValue page into the cache."""
+        try:
+            response = await client.batch_get_secret_value(SecretIdList=chunk)
+        except Exception:
+            # Older botocore or unsupported region: resolve individually
+            return
+
+        for entry in response.get("SecretValues", []):
+            for secret_id in (entry.get("Name"), entry.get("ARN")):
+                if secret_id in names:
+                    self._cache_put((self._profile, region, secret_id), self._stored_value(entry))
+
+    async def _get_client(self, region: str, reference: str) -> Any:
+        """Get the persistent Secrets Manager client for the profile and region."""
+        key = (self._profile, region)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
 
-    async def _fetch_secret(self, region: str, secret_name: str) -> str:
-        """Fetch a secret using boto3."""
         try:
-            import boto3
-            from botocore.exceptions import ClientError
+            from aiobotocore.config import AioConfig
+            from aiobotocore.session import get_session
         except ImportError as exc:
             raise ProviderError(
-                "boto3 is required for aws-secrets provider. "
+                "aiobotocore is required for aws-secrets provider. "
                 "Install it with: pip install use-env[aws]",
                 provider=self.info.name,
-                reference=f"{region}/{secret_name}",
+                reference=reference,
             ) from exc
 
-        # Create a session if not exists
-        if self._session is None:
-            if self._profile:
-                import os
+        async with self._client_lock:
+            client = self._clients.get(key)
+            if client is None:
+                # One session per profile, so reconfiguring never reuses a stale one
+                session = self._sessions.get(self._profile)
+                if session is None:
+                    session = get_session()
+                    if self._profile:
+                        session.set_config_variable("profile", self._profile)
+                    self._sessions[self._profile] = session
+
+                client = await self._client_stack.enter_async_context(
+                    session.create_client(
+                        "secretsmanager",
+                        region_name=region,
+                        config=AioConfig(max_pool_connections=_MAX_POOL_CONNECTIONS),
+                    )
+                )
+                self._clients[key] = client
+
+        return client
 
-                os.environ["AWS_PROFILE"] = self._profile
-            self._session = boto3.session.Session(region_name=region)
+    async def _fetch_secret(self, region: str, secret_name: str) -> str | bytes:
+        """Fetch a secret's stored value using aiobotocore."""
+        client = await self._get_client(region, f"{region}/{secret_name}")
 
-        client = self._session.client(service_name="secretsmanager", region_name=region)
+        from botocore.exceptions import ClientError
 
         try:
-            response = client.get_secret_value(SecretId=secret_name)
+            response = await client.get_secret_value(SecretId=secret_name)
         except ClientError as exc:
             error_code = exc.response.get("Error", {}).get("Code", "Unknown")
 
@@ -150,39 +391,87 @@ class AwsSecretsProvider(Provider):
                     reference=f"{region}/{secret_name}",
                 ) from exc
 
-        # Return the secret value
+        return self._stored_value(response)
+
+    @staticmethod
+    def _stored_value(response: dict[str, Any]) -> str | bytes:
+        """Return SecretString, or SecretBinary for binary secrets."""
         if "SecretString" in response:
-            secret = json.loads(response["SecretString"])
-
-            # If the secret is a JSON object with a single value, return just the value
-            if isinstance(secret, dict):
-                if len(secret) == 1:
-                    return list(secret.values())[0]
-                # If it has 'password' key, return that
-                if "password" in secret:
-                    return secret["password"]
-                # If it has the same key as the secret name, return that
-                if secret_name in secret:
-                    return secret[secret_name]
-                # Otherwise return the whole JSON
-                return json.dumps(secret)
-
-            return str(secret)
-        else:
+            return response["SecretString"]
+        return response["SecretBinary"]
+
+    @staticmethod
+    def _decode_secret(secret_name: str, stored: str | bytes, flag: str | None = None) -> str:
+        """Turn a stored secret value into the string a reference resolves to.
+
+        Raises ValueError, KeyError or TypeError when ``flag`` asks for JSON
+        the value does not hold.
+        """
+        if isinstance(stored, bytes):
             # Binary secret
-            return response["SecretBinary"].decode("utf-8")
+            secret_string = stored.decode("utf-8")
+            if flag is None:
+                return secret_string
+        else:
+            secret_string = stored
+
+        if flag == "raw":
+            return secret_string
+
+        if flag is not None:
+            secret = _json_loads(secret_string)
+            if flag == "json":
+                return secret_string
+            value = secret[flag[4:]]
+            return value if isinstance(value, str) else json.dumps(value)
+
+        # Only JSON objects get key extraction; anything else is returned as stored
+        if not secret_string.startswith("{"):
+            return secret_string
+
+        try:
+            secret = _json_loads(secret_string)
+        except ValueError:
+            return secret_string
+
+        # If the secret is a JSON object with a single value, return just the value
+        if isinstance(secret, dict):
+            if len(secret) == 1:
+                return next(iter(secret.values()))
+            # If it has 'password' key, return that
+            if "password" in secret:
+                return secret["password"]
+            # If it has the same key as the secret name, return that
+            if secret_name in secret:
+                return secret[secret_name]
+
+        # Otherwise return the whole JSON as stored, without re-encoding it
+        return secret_string
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the AWS Secrets provider."""
+        super().configure(config)
         if "region" in config:
             self._region = config["region"]
         if "profile" in config:
             self._profile = config["profile"]
+        if "cache_ttl" in config:
+            self._cache_ttl = float(config["cache_ttl"])
+        if "max_stale" in config:
+            self._max_stale = float(config["max_stale"])
+        if "cache_maxsize" in config:
+            # The cache is process-wide, so this bounds it for every instance
+            self._shared_cache.maxsize = int(config["cache_maxsize"])
 
     async def close(self) -> None:
-        """Clean up resources."""
-        self._cache.clear()
-        self._session = None
+        """Clean up resources.
+
+        The shared secret cache is kept so later loads can reuse it.
+        """
+        await super().close()
+        await self._client_stack.aclose()
+        self._clients.clear()
+        self._sessions.clear()
 
 
 def create_provider() -> AwsSecretsProvider:
@@ -17,10 +17,13 @@ Install with: pip install use-env[azure]
 
 from __future__ import annotations
 
-import re
+import asyncio
+from functools import cache
 from typing import Any
 
-from . import Provider, ProviderError, ProviderInfo
+from . import Provider, ProviderError, ProviderInfo, TTLCache, shared_client
+
+_REFERENCE_PATTERN = r"^(?P<vault_name>[^/]+)/(?P<secret_name>.+)$"
 
 
 class AzureKeyVaultProvider(Provider):
@@ -33,6 +36,9 @@ class AzureKeyVaultProvider(Provider):
         tenant_id: Azure tenant ID (optional, uses default credential)
         client_id: Azure client ID (optional, uses default credential)
         client_secret: Azure client secret (optional, uses default credential)
+        batch_concurrency: Maximum concurrent lookups in resolve_batch (default: 16)
+        cache_maxsize: Maximum cached values (default: 1024)
+        cache_ttl: Seconds to reuse a resolved value (default: 300, 0 disables)
 
     Install with: pip install use-env[azure]
     """
@@ -42,7 +48,7 @@ class AzureKeyVaultProvider(Provider):
         description="Azure Key Vault provider (SDK-based)",
         version="1.0.0",
         author="use-env contributors",
-        reference_pattern=r"^(?P<vault_name>[^/]+)/(?P<secret_name>.+)$",
+        reference_pattern=_REFERENCE_PATTERN,
         help=(
             "Azure Key Vault provider using the Azure SDK.\n\n"
             "Setup:\n"
@@ -68,8 +74,7 @@ class AzureKeyVaultProvider(Provider):
 
     def __init__(self) -> None:
         super().__init__()
-        self._client: Any | None = None
-        self._cache: dict[str, str] = {}
+        self._cache = TTLCache()
 
     async def resolve(self, reference: str) -> str:
         """
@@ -85,24 +90,24 @@ class AzureKeyVaultProvider(Provider):
             ProviderError: If the secret cannot be resolved
         """
         # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
+        cached = self._cache.get(reference)
+        if cached is not None:
+            return cached
 
-        # Parse the reference
-        match = re.match(self.info.reference_pattern, reference)
-        if not match:
+        parsed = self._parse_ref(reference)
+        if parsed is None:
             raise ProviderError(
                 f"Invalid Azure Key Vault reference format: {reference}",
                 provider=self.info.name,
                 reference=reference,
             )
-
-        vault_name = match.group("vault_name")
-        secret_name = match.group("secret_name")
+        vault_name, secret_name = parsed
 
         # Fetch the secret
         try:
-            value = await self._fetch_secret(vault_name, secret_name)
+            value = await self._coalesce(
+                reference, lambda: self._fetch_secret(vault_name, secret_name)
+            )
         except Exception as exc:
             raise ProviderError(
                 f"Failed to fetch secret from Azure Key Vault: {exc}",
@@ -115,11 +120,25 @@ class AzureKeyVaultProvider(Provider):
 
         return value
 
+    @staticmethod
+    def _parse_ref(reference: str) -> tuple[str, str] | None:
+        """Split a reference into (vault_name, secret_name), or None if malformed.
+
+        Equivalent to reference_pattern, without going through the regex engine.
+        """
+        vault_name, _, secret_name = reference.partition("/")
+        if not vault_name or not secret_name:
+            return None
+        return vault_name, secret_name
+
+    def cached_value(self, reference: str) -> str | None:
+        """Return the cached value for reference without awaiting, or None."""
+        return self._cache.get(reference)
+
     async def _fetch_secret(self, vault_name: str, secret_name: str) -> str:
         """Fetch a secret using Azure SDK."""
         try:
-            from azure.identity import DefaultAzureCredential
-            from azure.keyvault.secrets import SecretClient
+            DefaultAzureCredential, SecretClient = _load_sdk()
         except ImportError as exc:
             raise ProviderError(
                 "Azure SDK is required for azure-keyvault provider. "
@@ -128,15 +147,15 @@ class AzureKeyVaultProvider(Provider):
                 reference=f"{vault_name}/{secret_name}",
             ) from exc
 
-        # Create client
+        # Get (or create) the process-wide client for this vault
         vault_url = f"https://{vault_name}.vault.azure.net"
+        client = shared_client(
+            ("azure-keyvault", vault_url),
+            lambda: SecretClient(vault_url=vault_url, credential=DefaultAzureCredential()),
+        )
 
-        if self._client is None:
-            credential = DefaultAzureCredential()
-            self._client = SecretClient(vault_url=vault_url, credential=credential)
-
-        # Get the secret
-        secret = self._client.get_secret(secret_name)
+        # Get the secret; the SDK call blocks, so keep it off the event loop
+        secret = await asyncio.to_thread(client.get_secret, secret_name)
         if secret.value is None:
             raise ProviderError(
                 f"Secret '{secret_name}' has no value",
@@ -147,17 +166,36 @@ class AzureKeyVaultProvider(Provider):
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the Azure Key Vault provider."""
+        super().configure(config)
         if "tenant_id" in config:
             self._tenant_id = config["tenant_id"]
         if "client_id" in config:
             self._client_id = config["client_id"]
         if "client_secret" in config:
             self._client_secret = config["client_secret"]
+        if "cache_maxsize" in config or "cache_ttl" in config:
+            self._cache = TTLCache.from_config(config)
 
     async def close(self) -> None:
-        """Clean up resources."""
+        """Clean up resources.
+
+        Clients are shared process-wide and stay open for later instances.
+        """
+        await super().close()
         self._cache.clear()
-        self._client = None
+
+
+@cache
+def _load_sdk() -> tuple[Any, Any]:
+    """Import the Azure SDK classes on first use.
+
+    The import is deferred because this module is loaded with the built-in
+    providers; the result is cached so resolves don't re-run the import.
+    """
+    from azure.identity import DefaultAzureCredential
+    from azure.keyvault.secrets import SecretClient
+
+    return DefaultAzureCredential, SecretClient
 
 
 def create_provider() -> AzureKeyVaultProvider:
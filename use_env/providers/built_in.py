@@ -22,13 +22,8 @@ def register_built_in_providers() -> None:
     if _registered:
         return
 
-    # Check if already registered before trying
-    if not ProviderRegistry.is_registered("azure-keyvault"):
-        ProviderRegistry.register(AzureKeyVaultProvider)
-    if not ProviderRegistry.is_registered("env"):
-        ProviderRegistry.register(EnvironmentProvider)
-    if not ProviderRegistry.is_registered("file"):
-        ProviderRegistry.register(FileProvider)
+    for provider_class in (AzureKeyVaultProvider, EnvironmentProvider, FileProvider):
+        ProviderRegistry.register(provider_class, exist_ok=True)
 
     _registered = True
 
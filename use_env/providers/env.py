@@ -16,10 +16,9 @@ Example:
 from __future__ import annotations
 
 import os
-import re
 from typing import Any
 
-from . import Provider, ProviderError, ProviderInfo
+from . import Provider, ProviderError, ProviderInfo, TTLCache
 
 
 class EnvironmentProvider(Provider):
@@ -35,6 +34,11 @@ class EnvironmentProvider(Provider):
         APP_ENV=${env:APP_ENV}
 
         # These will use the current environment values
+
+    Configuration:
+        cache_enabled: Reuse resolved values (default: True)
+        cache_maxsize: Maximum cached values (default: 1024)
+        cache_ttl: Seconds to reuse a resolved value (default: 300, 0 disables)
     """
 
     info = ProviderInfo(
@@ -47,7 +51,8 @@ class EnvironmentProvider(Provider):
 
     def __init__(self) -> None:
         super().__init__()
-        self._cache: dict[str, str] = {}
+        self._cache = TTLCache()
+        self._cache_enabled = True
 
     async def resolve(self, reference: str) -> str:
         """
@@ -63,23 +68,20 @@ class EnvironmentProvider(Provider):
             ProviderError: If the variable is not set
         """
         # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
-
-        # Parse the reference (remove env: prefix if present)
-        match = re.match(self.info.reference_pattern, reference)
-        if not match:
-            # Try alternate format with env: prefix
-            alt_pattern = r"^env:(?P<variable_name>[A-Za-z_][A-Za-z0-9_]*)$"
-            match = re.match(alt_pattern, reference)
-            if not match:
-                raise ProviderError(
-                    f"Invalid environment variable reference: {reference}",
-                    provider=self.info.name,
-                    reference=reference,
-                )
-
-        var_name = match.group("variable_name")
+        if self._cache_enabled:
+            cached = self._cache.get(reference)
+            if cached is not None:
+                return cached
+
+        # Parse the reference (remove env: prefix if present). An ASCII
+        # identifier is exactly [A-Za-z_][A-Za-z0-9_]*, so no regex is needed.
+        var_name = reference.removeprefix("env:")
+        if not (var_name.isascii() and var_name.isidentifier()):
+            raise ProviderError(
+                f"Invalid environment variable reference: {reference}",
+                provider=self.info.name,
+                reference=reference,
+            )
 
         # Get the value
         value = os.environ.get(var_name)
@@ -92,17 +94,62 @@ class EnvironmentProvider(Provider):
             )
 
         # Cache the result
-        self._cache[reference] = value
+        if self._cache_enabled:
+            self._cache[reference] = value
 
         return value
 
+    def cached_value(self, reference: str) -> str | None:
+        """Return the cached value for reference without awaiting, or None."""
+        return self._cache.get(reference) if self._cache_enabled else None
+
+    async def resolve_batch(
+        self,
+        references: list[str],
+        progress_callback: Any | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, str]:
+        """
+        Resolve many variables from one snapshot of the environment.
+
+        ``os.environ`` encodes and decodes on every lookup, so the batch copies
+        it once into a plain dict. References that are invalid or unset fall
+        back to ``resolve``, which raises the usual error.
+        """
+        environ = dict(os.environ)
+        cache = self._cache if self._cache_enabled else None
+        results: dict[str, str] = {}
+        total = len(references)
+
+        for index, reference in enumerate(references):
+            if progress_callback:
+                progress_callback(reference, index, total)
+
+            var_name = reference.removeprefix("env:")
+            value = (
+                environ.get(var_name) if var_name.isascii() and var_name.isidentifier() else None
+            )
+            if value is None:
+                results[reference] = await self.resolve(reference)
+                continue
+
+            if cache is not None:
+                cache[reference] = value
+            results[reference] = value
+
+        return results
+
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the environment provider with options."""
+        super().configure(config)
         if "cache_enabled" in config:
-            self._cache_enabled = config["cache_enabled"]
+            self._cache_enabled = bool(config["cache_enabled"])
+        if "cache_maxsize" in config or "cache_ttl" in config:
+            self._cache = TTLCache.from_config(config)
 
     async def close(self) -> None:
         """Clean up resources."""
+        await super().close()
         self._cache.clear()
 
 
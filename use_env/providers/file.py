@@ -15,6 +15,9 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import locale
+import os
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +34,9 @@ class FileProvider(Provider):
     Configuration:
         base_path: Base directory for relative paths (default: current directory)
         required: Whether files must exist (default: True)
+        check_mtime: Re-read cached files whose modification time changed (default: True)
+        eager: Read files on the event loop instead of a worker thread (default: False)
+        batch_concurrency: Maximum concurrent lookups in resolve_batch (default: 16)
 
     Example:
         # In your .env.dev file:
@@ -46,10 +52,15 @@ class FileProvider(Provider):
         reference_pattern=r"^(?P<path>.+)$",
     )
 
-    def __init__(self, base_path: str | None = None) -> None:
+    def __init__(
+        self, base_path: str | None = None, check_mtime: bool = True, eager: bool = False
+    ) -> None:
         super().__init__()
         self._base_path = Path(base_path) if base_path else Path.cwd()
-        self._cache: dict[str, str] = {}
+        self._check_mtime = check_mtime
+        self._eager = eager
+        # Canonical path -> (st_mtime_ns when read, value)
+        self._cache: dict[str, tuple[int, str]] = {}
 
     async def resolve(self, reference: str) -> str:
         """
@@ -64,16 +75,26 @@ class FileProvider(Provider):
         Raises:
             ProviderError: If the file cannot be read
         """
-        # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
-
-        # Resolve the path
+        # Resolve the path; the cache is keyed by the canonical path so aliases
+        # like "x.txt", "./x.txt" and "/abs/x.txt" share one entry
         file_path = self._resolve_path(reference)
+        cache_key = os.path.realpath(file_path)
+
+        # Check cache first
+        cached = self._cache.get(cache_key)
+        if cached is not None and not self._check_mtime:
+            return cached[1]
 
-        # Read the file
+        # Read the file, unless the cached copy is still current. Blocking I/O
+        # runs in a worker thread so concurrent resolutions are not stalled.
         try:
-            value = file_path.read_text().strip()
+            if self._eager:
+                mtime_ns, value = self._read_file(file_path, cached)
+            else:
+                # Concurrent reads of the same file share one worker thread
+                mtime_ns, value = await self._coalesce(
+                    cache_key, lambda: asyncio.to_thread(self._read_file, file_path, cached)
+                )
         except FileNotFoundError as exc:
             raise ProviderError(
                 f"Secret file not found: {file_path}",
@@ -94,10 +115,29 @@ class FileProvider(Provider):
             ) from exc
 
         # Cache the result
-        self._cache[reference] = value
+        self._cache[cache_key] = (mtime_ns, value)
 
         return value
 
+    def cached_value(self, reference: str) -> str | None:
+        """Return the cached value for reference without awaiting, or None.
+
+        With check_mtime on, a cached value may be stale, so None is returned
+        and ``resolve`` checks the modification time first.
+        """
+        if self._check_mtime:
+            return None
+        cached = self._cache.get(os.path.realpath(self._resolve_path(reference)))
+        return None if cached is None else cached[1]
+
+    def _read_file(self, file_path: Path, cached: tuple[int, str] | None) -> tuple[int, str]:
+        """Stat and read a file, reusing the cached value if its mtime is unchanged."""
+        mtime_ns = os.stat(file_path).st_mtime_ns if self._check_mtime else 0
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+
+        return mtime_ns, _read_text(file_path).strip()
+
     def _resolve_path(self, reference: str) -> Path:
         """Resolve a file path from the reference."""
         # Handle file:// prefix
@@ -114,28 +154,43 @@ class FileProvider(Provider):
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the file provider with options."""
+        super().configure(config)
         if "base_path" in config:
             self._base_path = Path(config["base_path"])
+        if "check_mtime" in config:
+            self._check_mtime = bool(config["check_mtime"])
+        if "eager" in config:
+            self._eager = bool(config["eager"])
 
     async def close(self) -> None:
         """Clean up resources."""
+        await super().close()
         self._cache.clear()
 
-    async def resolve_batch(
-        self, references: list[str], progress_callback: Any | None = None
-    ) -> dict[str, str]:
-        """Resolve multiple files efficiently."""
-        results: dict[str, str] = {}
-
-        for i, ref in enumerate(references):
-            if progress_callback:
-                progress_callback(ref, i, len(references))
 
-            results[ref] = await self.resolve(ref)
+def _read_text(path: Path) -> str:
+    """Read a whole file as text with plain os.read calls.
 
-        return results
-
-
-def create_provider(base_path: str | None = None) -> FileProvider:
+    Secret files are small, so this skips the buffered TextIOWrapper stack
+    while decoding and translating newlines the way ``Path.read_text`` does.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        # One read normally suffices; the loop covers files that grow or lie about size
+        chunks = [os.read(fd, os.fstat(fd).st_size + 1)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+
+    text = b"".join(chunks).decode(locale.getpreferredencoding(False))
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def create_provider(
+    base_path: str | None = None, check_mtime: bool = True, eager: bool = False
+) -> FileProvider:
     """Factory function to create a FileProvider instance."""
-    return FileProvider(base_path)
+    return FileProvider(base_path, check_mtime, eager)
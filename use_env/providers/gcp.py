@@ -16,10 +16,13 @@ Install with: pip install use-env[gcp]
 
 from __future__ import annotations
 
-import re
+import asyncio
+from functools import cache
 from typing import Any
 
-from . import Provider, ProviderError, ProviderInfo
+from . import Provider, ProviderError, ProviderInfo, TTLCache, shared_client
+
+_REFERENCE_PATTERN = r"^(?P<project_id>[^/]+)/(?P<secret_name>[^/]+)(?:/(?P<version>.+))?$"
 
 
 class GcpSecretsProvider(Provider):
@@ -30,6 +33,9 @@ class GcpSecretsProvider(Provider):
 
     Configuration:
         project_id: GCP project ID (optional, uses default)
+        batch_concurrency: Maximum concurrent lookups in resolve_batch (default: 16)
+        cache_maxsize: Maximum cached values (default: 1024)
+        cache_ttl: Seconds to reuse a resolved value (default: 300, 0 disables)
 
     Install with: pip install use-env[gcp]
     """
@@ -39,13 +45,14 @@ class GcpSecretsProvider(Provider):
         description="Google Cloud Secret Manager provider",
         version="1.0.0",
         author="use-env contributors",
-        reference_pattern=r"^(?P<project_id>[^/]+)/(?P<secret_name>[^/]+)(?:/(?P<version>.+))?$",
+        reference_pattern=_REFERENCE_PATTERN,
     )
 
     def __init__(self) -> None:
         super().__init__()
         self._client: Any | None = None
-        self._cache: dict[str, str] = {}
+        # (project_id, secret_name, version) -> value
+        self._cache = TTLCache()
         self._default_project: str | None = None
 
     async def resolve(self, reference: str) -> str:
@@ -61,26 +68,25 @@ class GcpSecretsProvider(Provider):
         Raises:
             ProviderError: If resolution fails
         """
-        # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
-
-        # Parse the reference
-        match = re.match(self.info.reference_pattern, reference)
-        if not match:
+        key = self._parse_ref(reference)
+        if key is None:
             raise ProviderError(
                 f"Invalid GCP Secret Manager reference format: {reference}",
                 provider=self.info.name,
                 reference=reference,
             )
+        project_id, secret_name, version = key
 
-        project_id = match.group("project_id")
-        secret_name = match.group("secret_name")
-        version = match.group("version") or "latest"
+        # Check cache first; "p/s" and "p/s/latest" name the same version
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
         # Fetch the secret
         try:
-            value = await self._fetch_secret(project_id, secret_name, version)
+            value = await self._coalesce(
+                key, lambda: self._fetch_secret(project_id, secret_name, version)
+            )
         except Exception as exc:
             raise ProviderError(
                 f"Failed to fetch secret from GCP Secret Manager: {exc}",
@@ -89,14 +95,30 @@ class GcpSecretsProvider(Provider):
             ) from exc
 
         # Cache the result
-        self._cache[reference] = value
+        self._cache[key] = value
 
         return value
 
+    @staticmethod
+    def _parse_ref(reference: str) -> tuple[str, str, str] | None:
+        """Split a reference into (project_id, secret_name, version), or None if malformed.
+
+        Equivalent to reference_pattern; the version defaults to "latest".
+        """
+        parts = reference.split("/", 2)
+        if len(parts) < 2 or not all(parts):
+            return None
+        return parts[0], parts[1], parts[2] if len(parts) == 3 else "latest"
+
+    def cached_value(self, reference: str) -> str | None:
+        """Return the cached value for reference without awaiting, or None."""
+        key = self._parse_ref(reference)
+        return None if key is None else self._cache.get(key)
+
     async def _fetch_secret(self, project_id: str, secret_name: str, version: str) -> str:
         """Fetch a secret using GCP Secret Manager client."""
         try:
-            from google.cloud import secretmanager
+            secretmanager = _load_sdk()
         except ImportError as exc:
             raise ProviderError(
                 "google-cloud-secret-manager is required for gcp-secrets provider. "
@@ -105,30 +127,47 @@ class GcpSecretsProvider(Provider):
                 reference=f"{project_id}/{secret_name}/{version}",
             ) from exc
 
-        # Create client
+        # Get (or create) the process-wide client; it is not tied to a project
         if self._client is None:
-            self._client = secretmanager.SecretManagerServiceClient()
+            self._client = shared_client(("gcp-secrets",), secretmanager.SecretManagerServiceClient)
 
         # Build the secret path
         name = f"projects/{project_id}/secrets/{secret_name}/versions/{version}"
 
-        # Access the secret
-        response = self._client.access_secret_version(request={"name": name})
+        # Access the secret; the SDK call blocks, so keep it off the event loop
+        response = await asyncio.to_thread(
+            self._client.access_secret_version, request={"name": name}
+        )
 
         # Return the payload
         return response.payload.data.decode("UTF-8")
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the GCP Secret Manager provider."""
+        super().configure(config)
         if "project_id" in config:
             self._default_project = config["project_id"]
+        if "cache_maxsize" in config or "cache_ttl" in config:
+            self._cache = TTLCache.from_config(config)
 
     async def close(self) -> None:
-        """Clean up resources."""
+        """Clean up resources.
+
+        The client is shared process-wide; only this instance's reference is dropped.
+        """
+        await super().close()
         self._cache.clear()
         self._client = None
 
 
+@cache
+def _load_sdk() -> Any:
+    """Import google.cloud.secretmanager on first use and cache the module."""
+    from google.cloud import secretmanager
+
+    return secretmanager
+
+
 def create_provider() -> GcpSecretsProvider:
     """Factory function to create a GcpSecretsProvider instance."""
     return GcpSecretsProvider()
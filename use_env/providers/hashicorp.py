@@ -18,12 +18,41 @@ Install with: pip install use-env[vault]
 
 from __future__ import annotations
 
-import re
+import asyncio
+import hashlib
+import json
+import os
+from functools import cache
 from typing import Any
 
-from hvac.exceptions import InvalidPath
+from . import Provider, ProviderError, ProviderInfo, TTLCache, shared_client
 
-from . import Provider, ProviderError, ProviderInfo
+
+def _stdlib_json_dumps(data: Any) -> str:
+    """Serialize data the way orjson does, so output doesn't depend on the extra.
+
+    orjson writes compact separators and leaves non-ASCII text unescaped.
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:
+    _json_dumps = _stdlib_json_dumps
+
+
+_REFERENCE_PATTERN = r"^(?P<mount_point>[^/]+)/(?P<path>.+)$"
+
+# One requests.Session behind every hvac client, so keep-alive connections are
+# reused across clients and reads instead of each client opening its own pool
+_SESSION: Any | None = None
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 32
 
 
 class HashiCorpVaultProvider(Provider):
@@ -37,6 +66,9 @@ class HashiCorpVaultProvider(Provider):
         token: Vault token (default: VAULT_TOKEN env var)
         namespace: Vault namespace (for Enterprise Vault)
         mount_point: Default mount point (default: secret)
+        batch_concurrency: Maximum concurrent lookups in resolve_batch (default: 16)
+        cache_maxsize: Maximum cached values (default: 1024)
+        cache_ttl: Seconds to reuse a resolved value (default: 300, 0 disables)
 
     Install with: pip install use-env[vault]
     """
@@ -46,13 +78,15 @@ class HashiCorpVaultProvider(Provider):
         description="HashiCorp Vault provider",
         version="1.0.0",
         author="use-env contributors",
-        reference_pattern=r"^(?P<mount_point>[^/]+)/(?P<path>.+)$",
+        reference_pattern=_REFERENCE_PATTERN,
     )
 
     def __init__(self) -> None:
         super().__init__()
         self._client: Any | None = None
-        self._cache: dict[str, str] = {}
+        self._cache = TTLCache()
+        # (mount_point, secret_path) -> secret data, shared by sibling fields
+        self._secrets = TTLCache()
         self._url: str | None = None
         self._token: str | None = None
         self._namespace: str | None = None
@@ -72,24 +106,24 @@ class HashiCorpVaultProvider(Provider):
             ProviderError: If resolution fails
         """
         # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
+        cached = self._cache.get(reference)
+        if cached is not None:
+            return cached
 
-        # Parse the reference
-        match = re.match(self.info.reference_pattern, reference)
-        if not match:
+        parsed = self._parse_ref(reference)
+        if parsed is None:
             raise ProviderError(
                 f"Invalid HashiCorp Vault reference format: {reference}",
                 provider=self.info.name,
                 reference=reference,
             )
-
-        mount_point = match.group("mount_point")
-        path = match.group("path")
+        mount_point, path = parsed
 
         # Fetch the secret
         try:
             value = await self._fetch_secret(mount_point, path)
+        except ProviderError:
+            raise
         except Exception as exc:
             raise ProviderError(
                 f"Failed to fetch secret from HashiCorp Vault: {exc}",
@@ -102,16 +136,63 @@ class HashiCorpVaultProvider(Provider):
 
         return value
 
+    @staticmethod
+    def _parse_ref(reference: str) -> tuple[str, str] | None:
+        """Split a reference into (mount_point, path), or None if malformed."""
+        mount_point, _, path = reference.partition("/")
+        if not mount_point or not path:
+            return None
+        return mount_point, path
+
+    def cached_value(self, reference: str) -> str | None:
+        """Return the cached value for reference without awaiting, or None."""
+        return self._cache.get(reference)
+
     async def _fetch_secret(self, mount_point: str, path: str) -> str:
-        """Fetch a secret using hvac library."""
-        try:
-            import hvac
-        except ImportError as exc:
+        """Fetch a secret (or one field of it) using hvac library."""
+        secret_path, field = _split_path(path)
+        data = await self._read_secret(mount_point, secret_path, f"{mount_point}/{path}")
+        return self._extract(data, field, mount_point, secret_path)
+
+    def _extract(
+        self, data: dict[str, Any], field: str | None, mount_point: str, secret_path: str
+    ) -> str:
+        """Pick a field, the only value, or the whole secret as JSON from data."""
+        if field:
+            if field in data:
+                return str(data[field])
             raise ProviderError(
-                "hvac is required for vault provider. Install it with: pip install use-env[vault]",
+                f"Field '{field}' not found in secret at {mount_point}/{secret_path}",
                 provider=self.info.name,
-                reference=f"{mount_point}/{path}",
-            ) from exc
+                reference=f"{mount_point}/{secret_path}/{field}",
+            )
+
+        # If no field specified and single key, return that
+        if len(data) == 1:
+            return str(next(iter(data.values())))
+
+        # Return the whole secret as JSON
+        return _json_dumps(data)
+
+    async def _read_secret(
+        self, mount_point: str, secret_path: str, reference: str
+    ) -> dict[str, Any]:
+        """Read the data of a secret once; sibling fields share the response."""
+        key = (mount_point, secret_path)
+        data = self._secrets.get(key)
+        if data is not None:
+            return data
+
+        # Concurrent reads of the same secret share one request
+        return await self._coalesce(
+            key, lambda: self._load_secret(mount_point, secret_path, reference)
+        )
+
+    async def _load_secret(
+        self, mount_point: str, secret_path: str, reference: str
+    ) -> dict[str, Any]:
+        """Read a secret from Vault and cache its data."""
+        key = (mount_point, secret_path)
 
         # Create client
         if self._client is None:
@@ -120,82 +201,110 @@ class HashiCorpVaultProvider(Provider):
 
             # Try environment variables if not provided
             if not token:
-                import os
-
                 token = os.environ.get("VAULT_TOKEN")
 
             if not token:
                 raise ProviderError(
                     "Vault token not configured. Set VAULT_TOKEN env var or configure in .use-env.yaml",
                     provider=self.info.name,
-                    reference=f"{mount_point}/{path}",
+                    reference=reference,
                 )
 
-            self._client = hvac.Client(url=url, token=token)
-
-            if self._namespace:
-                self._client.headers["X-Vault-Namespace"] = self._namespace
-
-        # Parse path to separate path from field
-        parts = path.split("/")
-        secret_path = "/".join(parts[:-1]) if len(parts) > 1 else parts[0]
-        field = parts[-1] if len(parts) > 1 else None
-
-        # Read the secret
-        try:
-            # Try KV v2 first
-            response = self._client.secrets.kv.v2.read_secret_version(
-                path=secret_path, mount_point=mount_point
-            )
-
-            data = response.get("data", {}).get("data", {})
-
-            if field:
-                if field in data:
-                    return str(data[field])
-                else:
-                    raise ProviderError(
-                        f"Field '{field}' not found in secret at {mount_point}/{secret_path}",
-                        provider=self.info.name,
-                        reference=f"{mount_point}/{path}",
-                    )
-
-            # If no field specified and single key, return that
-            if len(data) == 1:
-                return list(data.values())[0]
-
-            # Return the whole secret as JSON
-            import json
+            try:
+                Client, _ = _load_sdk()
+            except ImportError as exc:
+                raise ProviderError(
+                    "hvac is required for the vault provider. "
+                    "Install it with: pip install use-env[vault]",
+                    provider=self.info.name,
+                    reference=reference,
+                ) from exc
+
+            namespace = self._namespace
+
+            def build() -> Any:
+                client = Client(url=url, token=token, session=_shared_session())
+                if namespace:
+                    client.headers["X-Vault-Namespace"] = namespace
+                return client
+
+            token_digest = hashlib.sha256(token.encode()).hexdigest()
+            self._client = shared_client(("vault", url, token_digest, namespace), build)
+
+        # Read the secret; hvac blocks, so keep it off the event loop
+        data = await asyncio.to_thread(_read_kv, self._client, mount_point, secret_path)
+
+        self._secrets[key] = data
+        return data
+
+    async def resolve_batch(
+        self,
+        references: list[str],
+        progress_callback: Any | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, str]:
+        """Resolve multiple secrets, reading each Vault secret once.
+
+        References are grouped by (mount_point, secret_path) and each secret is
+        read once up front; fields are then picked from that data, even when
+        cache_ttl 0 keeps it out of the cache. References whose read failed
+        go through ``resolve``, which reports the error for that reference.
+        """
+        groups: dict[tuple[str, str], str] = {}
+        for reference in references:
+            if reference in self._cache:
+                continue
+            parsed = self._parse_ref(reference)
+            if parsed is not None:
+                mount_point, path = parsed
+                secret_path, _ = _split_path(path)
+                groups.setdefault((mount_point, secret_path), reference)
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
+        secrets: dict[tuple[str, str], dict[str, Any]] = {}
+
+        async def read_one(mount_point: str, secret_path: str, reference: str) -> None:
+            async with semaphore:
+                secrets[mount_point, secret_path] = await self._read_secret(
+                    mount_point, secret_path, reference
+                )
 
-            return json.dumps(data)
+        await asyncio.gather(
+            *(read_one(mount, path, ref) for (mount, path), ref in groups.items()),
+            return_exceptions=True,
+        )
 
-        except InvalidPath:
-            # Try KV v1
-            response = self._client.secrets.kv.v1.read_secret(
-                path=secret_path, mount_point=mount_point
-            )
+        total = len(references)
 
-            data = response.get("data", {})
+        async def resolve_one(index: int, reference: str) -> str:
+            if progress_callback:
+                progress_callback(reference, index, total)
 
-            if field:
-                if field in data:
-                    return str(data[field])
-                else:
-                    raise ProviderError(
-                        f"Field '{field}' not found in secret at {mount_point}/{secret_path}",
-                        provider=self.info.name,
-                        reference=f"{mount_point}/{path}",
-                    )
+            cached = self._cache.get(reference)
+            if cached is not None:
+                return cached
 
-            if len(data) == 1:
-                return list(data.values())[0]
+            parsed = self._parse_ref(reference)
+            if parsed is not None:
+                mount_point, path = parsed
+                secret_path, field = _split_path(path)
+                data = secrets.get((mount_point, secret_path))
+                if data is not None:
+                    value = self._extract(data, field, mount_point, secret_path)
+                    self._cache[reference] = value
+                    return value
 
-            import json
+            async with semaphore:
+                return await self.resolve(reference)
 
-            return json.dumps(data)
+        values = await asyncio.gather(
+            *(resolve_one(i, reference) for i, reference in enumerate(references))
+        )
+        return dict(zip(references, values))
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the HashiCorp Vault provider."""
+        super().configure(config)
         if "url" in config:
             self._url = config["url"]
         if "token" in config:
@@ -204,13 +313,75 @@ class HashiCorpVaultProvider(Provider):
             self._namespace = config["namespace"]
         if "mount_point" in config:
             self._default_mount = config["mount_point"]
+        if "cache_maxsize" in config or "cache_ttl" in config:
+            self._cache = TTLCache.from_config(config)
+            self._secrets = TTLCache.from_config(config)
 
     async def close(self) -> None:
-        """Clean up resources."""
+        """Clean up resources.
+
+        The client is shared process-wide; only this instance's reference is dropped.
+        """
+        await super().close()
         self._cache.clear()
+        self._secrets.clear()
         self._client = None
 
 
+@cache
+def _load_sdk() -> tuple[Any, Any]:
+    """Import hvac on first use.
+
+    Importing hvac pulls in requests, so it is deferred until a secret is read;
+    the result is cached so reads don't re-run the import.
+    """
+    import hvac
+    from hvac.exceptions import InvalidPath
+
+    return hvac.Client, InvalidPath
+
+
+def _read_kv(client: Any, mount_point: str, secret_path: str) -> dict[str, Any]:
+    """Read a secret's data with hvac, trying KV v2 and then KV v1."""
+    _, InvalidPath = _load_sdk()
+    try:
+        # Try KV v2 first
+        response = client.secrets.kv.v2.read_secret_version(
+            path=secret_path, mount_point=mount_point
+        )
+        return response.get("data", {}).get("data", {})
+    except InvalidPath:
+        # Try KV v1
+        response = client.secrets.kv.v1.read_secret(path=secret_path, mount_point=mount_point)
+        return response.get("data", {})
+
+
+def _shared_session() -> Any:
+    """Return the requests.Session shared by all hvac clients.
+
+    Only called while building a client, under the lock shared_client holds.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def _split_path(path: str) -> tuple[str, str | None]:
+    """Split "secret/path/field" into (secret path, field); one segment has no field."""
+    secret_path, sep, field = path.rpartition("/")
+    if not sep:
+        return field, None
+    return secret_path, field
+
+
 def create_provider() -> HashiCorpVaultProvider:
     """Factory function to create a HashiCorpVaultProvider instance."""
     return HashiCorpVaultProvider()
@@ -19,10 +19,46 @@ Note: Requires a running 1Password Connect server.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import random
 import re
+import time
 from typing import Any
 
-from . import Provider, ProviderError, ProviderInfo
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import aiohttp
+    from yarl import URL  # installed with aiohttp
+except ImportError:
+    aiohttp = None
+
+from . import Provider, ProviderError, ProviderInfo, TTLCache
+
+_REFERENCE_PATTERN = (
+    r"^(?P<vault_id>[^/]+)/(?P<item_id>[^/]+)(?:/(?P<section>[^/]+))?/(?P<field>.+)$"
+)
+_REF_RE = re.compile(_REFERENCE_PATTERN)
+
+# Default cap on open connections in the provider's own session; see max_connections
+_MAX_CONNECTIONS = 32
+
+# Transient responses retried with jittered backoff; see max_attempts
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.1
+
+# After this many requests fail transiently in a row, Connect is not called
+# again for the cooldown, so an outage fails fast instead of per reference
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
 
 
 class OnePasswordProvider(Provider):
@@ -34,26 +70,45 @@ class OnePasswordProvider(Provider):
     Configuration:
         connect_url: 1Password Connect server URL
         connect_token: 1Password Connect server token
+        batch_concurrency: Maximum concurrent lookups in resolve_batch (default: 16)
+        max_connections: Maximum open connections to Connect (default: 32); not
+            applied when the loader shares its own session
+        max_attempts: Tries per request on 429/502/503/504 or connection
+            errors (default: 3)
+        cache_maxsize: Maximum cached values (default: 1024)
+        cache_ttl: Seconds to reuse a resolved value (default: 300, 0 disables);
+            a shorter Cache-Control max-age from Connect takes precedence
 
     Install with: pip install use-env[1password]
 
     Note: Requires a running 1Password Connect server.
     """
 
+    uses_http = True
+
     info = ProviderInfo(
         name="1password",
         description="1Password Connect provider",
         version="1.0.0",
         author="use-env contributors",
-        reference_pattern=r"^(?P<vault_id>[^/]+)/(?P<item_id>[^/]+)(?:/(?P<section>[^/]+))?/(?P<field>.+)$",
+        reference_pattern=_REFERENCE_PATTERN,
     )
 
     def __init__(self) -> None:
         super().__init__()
         self._session: Any | None = None
-        self._cache: dict[str, str] = {}
+        self._cache = TTLCache()
+        # (vault_id, item_id) -> ({field id or label: value}, max-age), filled by batches
+        self._items = TTLCache()
         self._connect_url: str | None = None
         self._connect_token: str | None = None
+        # (vaults endpoint URL, auth headers) once resolved from config or env vars
+        self._connection: tuple[Any, dict[str, str]] | None = None
+        self._max_connections = _MAX_CONNECTIONS
+        self._max_attempts = _MAX_ATTEMPTS
+        # Circuit breaker: consecutive transient failures, and when calls resume
+        self._failures = 0
+        self._open_until = 0.0
 
     async def resolve(self, reference: str) -> str:
         """
@@ -69,26 +124,27 @@ class OnePasswordProvider(Provider):
             ProviderError: If resolution fails
         """
         # Check cache first
-        if reference in self._cache:
-            return self._cache[reference]
+        cached = self._cache.get(reference)
+        if cached is not None:
+            return cached
 
-        # Parse the reference
-        match = re.match(self.info.reference_pattern, reference)
-        if not match:
+        parsed = self._parse_ref(reference)
+        if parsed is None:
             raise ProviderError(
                 f"Invalid 1Password reference format: {reference}",
                 provider=self.info.name,
                 reference=reference,
             )
-
-        vault_id = match.group("vault_id")
-        item_id = match.group("item_id")
-        section = match.group("section")
-        field = match.group("field")
+        vault_id, item_id, field = parsed
 
         # Fetch the secret
         try:
-            value = await self._fetch_secret(vault_id, item_id, section, field)
+            # Concurrent resolves of the same reference share one request
+            value, max_age = await self._coalesce(
+                reference, lambda: self._fetch_secret(reference, vault_id, item_id, field)
+            )
+        except ProviderError:
+            raise
         except Exception as exc:
             raise ProviderError(
                 f"Failed to fetch secret from 1Password: {exc}",
@@ -96,100 +152,296 @@ class OnePasswordProvider(Provider):
                 reference=reference,
             ) from exc
 
-        # Cache the result
-        self._cache[reference] = value
+        # Cache the result, for no longer than the server allows
+        self._cache.set(reference, value, max_age)
 
         return value
 
+    @staticmethod
+    def _parse_ref(reference: str) -> tuple[str, str, str] | None:
+        """Split a reference into (vault_id, item_id, field), or None if malformed.
+
+        The Connect field endpoint addresses fields by name, so the optional
+        section is dropped. Well-formed references are split with str.split;
+        anything else falls back to the regex so edge cases parse the same.
+        """
+        parts = reference.split("/", 3)
+        if len(parts) >= 3 and all(parts) and "\n" not in reference:
+            return parts[0], parts[1], parts[-1]
+
+        match = _REF_RE.match(reference)
+        if match is None:
+            return None
+        return match.group("vault_id", "item_id", "field")
+
+    def cached_value(self, reference: str) -> str | None:
+        """Return the cached value for reference without awaiting, or None."""
+        return self._cache.get(reference)
+
     async def _fetch_secret(
-        self, vault_id: str, item_id: str, section: str | None, field: str
-    ) -> str:
-        """Fetch a secret using 1Password Connect API."""
-        try:
-            import aiohttp
-        except ImportError as exc:
+        self, reference: str, vault_id: str, item_id: str, field: str
+    ) -> tuple[str, float | None]:
+        """Fetch a secret using 1Password Connect API.
+
+        Fields of an item read by resolve_batch are served from that item.
+        Returns the value and the response's Cache-Control max-age, if any.
+        """
+        item = self._items.get((vault_id, item_id))
+        if item is not None:
+            fields, max_age = item
+            value = fields.get(field)
+            if value is not None:
+                return value, max_age
+
+        body, max_age = await self._get(reference, vault_id, "items", item_id, "fields", field)
+        return _field_value(body), max_age
+
+    async def _fetch_item(self, reference: str, vault_id: str, item_id: str) -> None:
+        """Read a whole item once and keep its fields for the references to it."""
+        body, max_age = await self._get(reference, vault_id, "items", item_id)
+        self._items.set((vault_id, item_id), (_item_fields(body), max_age), max_age)
+
+    async def _get(self, reference: str, *path: str) -> tuple[bytes, float | None]:
+        """GET a path under the Connect vaults endpoint.
+
+        Returns the response body and its Cache-Control max-age, if any.
+        """
+        if aiohttp is None:
             raise ProviderError(
                 "aiohttp is required for 1password provider. "
                 "Install it with: pip install use-env[1password]",
                 provider=self.info.name,
-                reference=f"{vault_id}/{item_id}/{section or ''}/{field}",
-            ) from exc
+                reference=reference,
+            )
+
+        vaults_url, auth_headers = self._ensure_configured(reference)
+        url = vaults_url.joinpath(*path)
 
-        # Get configuration
-        connect_url = self._connect_url
-        connect_token = self._connect_token
+        # The provider's own session sends Authorization by default; the
+        # loader's session is shared with other providers, so it is sent per request
+        shared_session = self.lent_http_session()
+        if shared_session is not None:
+            session, headers = shared_session, auth_headers
+        else:
+            session, headers = self._get_session(auth_headers), None
 
-        # Try environment variables
-        if not connect_url:
-            import os
+        if time.monotonic() < self._open_until:
+            raise ProviderError(
+                "1Password Connect is unavailable after repeated failures; "
+                "not retrying until the cooldown ends",
+                provider=self.info.name,
+                reference=reference,
+            )
+
+        error: Exception | None = None
+        for attempt in range(self._max_attempts):
+            if attempt:
+                await asyncio.sleep(random.uniform(0, _RETRY_BACKOFF * 2**attempt))
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status in _RETRY_STATUSES:
+                        error = ProviderError(
+                            f"1Password API error: {response.status} {response.reason}",
+                            provider=self.info.name,
+                            reference=reference,
+                        )
+                        continue
+
+                    # Connect answered, whatever the status
+                    self._failures = 0
+                    if response.status == 401:
+                        raise ProviderError(
+                            "1Password Connect authentication failed - check your token",
+                            provider=self.info.name,
+                            reference=reference,
+                        )
+                    elif response.status == 404:
+                        raise ProviderError(
+                            f"1Password item or field not found: {reference}",
+                            provider=self.info.name,
+                            reference=reference,
+                        )
+                    elif not response.ok:
+                        raise ProviderError(
+                            f"1Password API error: {response.status} {response.reason}",
+                            provider=self.info.name,
+                            reference=reference,
+                        )
+
+                    body = await response.read()
+                    return body, _max_age(response.headers.get("Cache-Control"))
+            except aiohttp.ClientConnectionError as exc:
+                error = exc
+
+        self._failures += 1
+        if self._failures >= _BREAKER_THRESHOLD:
+            self._failures = 0
+            self._open_until = time.monotonic() + _BREAKER_COOLDOWN
+        if error is None:
+            # Unreachable while configure() keeps max_attempts at 1 or more
+            raise ProviderError(
+                "1Password request was not attempted",
+                provider=self.info.name,
+                reference=reference,
+            )
+        raise error
 
-            connect_url = os.environ.get("OP_CONNECT_HOST")
-        if not connect_token:
-            import os
+    def _ensure_configured(self, reference: str) -> tuple[Any, dict[str, str]]:
+        """Return the Connect vaults endpoint and auth headers, resolving them on first use.
 
-            connect_token = os.environ.get("OP_CONNECT_TOKEN")
+        Configured values win over the OP_CONNECT_HOST and OP_CONNECT_TOKEN
+        env vars. The result is kept until the next configure().
+        """
+        if self._connection is not None:
+            return self._connection
 
+        connect_url = self._connect_url or os.environ.get("OP_CONNECT_HOST")
+        connect_token = self._connect_token or os.environ.get("OP_CONNECT_TOKEN")
         if not connect_url or not connect_token:
             raise ProviderError(
                 "1Password Connect not configured. Set OP_CONNECT_HOST and OP_CONNECT_TOKEN "
                 "env vars or configure in .use-env.yaml",
                 provider=self.info.name,
-                reference=f"{vault_id}/{item_id}/{section or ''}/{field}",
+                reference=reference,
             )
 
-        # Build the API URL
-        if not connect_url.endswith("/"):
-            connect_url += "/"
-
-        url = f"{connect_url}v1/vaults/{vault_id}/items/{item_id}/fields/{field}"
-
-        # Make the request
-        import aiohttp
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers={"Authorization": f"Bearer {connect_token}"},
-            ) as response:
-                if response.status == 401:
-                    raise ProviderError(
-                        "1Password Connect authentication failed - check your token",
-                        provider=self.info.name,
-                        reference=f"{vault_id}/{item_id}/{section or ''}/{field}",
-                    )
-                elif response.status == 404:
-                    raise ProviderError(
-                        f"1Password item or field not found: {vault_id}/{item_id}/{field}",
-                        provider=self.info.name,
-                        reference=f"{vault_id}/{item_id}/{section or ''}/{field}",
-                    )
-                elif not response.ok:
-                    raise ProviderError(
-                        f"1Password API error: {response.status} {response.reason}",
-                        provider=self.info.name,
-                        reference=f"{vault_id}/{item_id}/{section or ''}/{field}",
-                    )
-
-                data = await response.json()
-
-                # Return the field value
-                return data.get("value", "")
+        auth_headers = {"Authorization": f"Bearer {connect_token}"}
+        if self._session is not None:
+            # The token may have changed through configure()
+            self._session.headers.update(auth_headers)
+
+        self._connection = (URL(connect_url) / "v1" / "vaults", auth_headers)
+        return self._connection
+
+    def _get_session(self, auth_headers: dict[str, str]) -> Any:
+        """Return the provider's own Connect session, creating one on first use.
+
+        The session is kept until close(), so keep-alive connections are
+        reused across resolves.
+        """
+        if self._session is None:
+            # No await between the check and the assignment, so no lock is needed
+            self._session = aiohttp.ClientSession(
+                headers=auth_headers,
+                connector=aiohttp.TCPConnector(limit=self._max_connections, keepalive_timeout=75),
+            )
+        return self._session
 
     def configure(self, config: dict[str, Any]) -> None:
         """Configure the 1Password Connect provider."""
+        super().configure(config)
         if "connect_url" in config:
             self._connect_url = config["connect_url"]
         if "connect_token" in config:
             self._connect_token = config["connect_token"]
+        self._connection = None
+        if "max_connections" in config:
+            self._max_connections = int(config["max_connections"])
+        if "max_attempts" in config:
+            max_attempts = int(config["max_attempts"])
+            if max_attempts < 1:
+                raise ProviderError(
+                    f"max_attempts must be at least 1, got {max_attempts}",
+                    provider=self.info.name,
+                )
+            self._max_attempts = max_attempts
+        if "cache_maxsize" in config or "cache_ttl" in config:
+            self._cache = TTLCache.from_config(config)
+            self._items = TTLCache.from_config(config)
+
+    async def resolve_batch(
+        self,
+        references: list[str],
+        progress_callback: Any | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, str]:
+        """Resolve multiple fields concurrently, up to ``batch_concurrency`` at a time.
+
+        When several uncached references share an item, the whole item is read
+        once up front and its fields are served from it. Reads that fail here
+        fall back to the per-field requests, which report the error.
+        """
+        concurrency = max_concurrency or self.batch_concurrency
+
+        items: dict[tuple[str, str], list[str]] = {}
+        for reference in references:
+            if reference in self._cache:
+                continue
+            parsed = self._parse_ref(reference)
+            if parsed is not None:
+                vault_id, item_id, _ = parsed
+                items.setdefault((vault_id, item_id), []).append(reference)
+
+        shared = [
+            (key, refs[0])
+            for key, refs in items.items()
+            if len(set(refs)) > 1 and key not in self._items
+        ]
+        if shared:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def read_item(key: tuple[str, str], reference: str) -> None:
+                async with semaphore:
+                    await self._coalesce(key, lambda: self._fetch_item(reference, *key))
+
+            await asyncio.gather(
+                *(read_item(key, reference) for key, reference in shared),
+                return_exceptions=True,
+            )
+
+        return await super().resolve_batch(references, progress_callback, concurrency)
 
     async def close(self) -> None:
         """Clean up resources."""
+        await super().close()
         self._cache.clear()
+        self._items.clear()
         if self._session:
             await self._session.close()
         self._session = None
 
 
+def _field_value(body: bytes) -> str:
+    """Return the top-level "value" of a Connect field response body, or ""."""
+    value = _json_loads(body).get("value")
+    return "" if value is None else str(value)
+
+
+def _item_fields(body: bytes) -> dict[str, str]:
+    """Map the field ids and labels of a Connect item response to their values."""
+    fields: dict[str, str] = {}
+    for item_field in _json_loads(body).get("fields") or ():
+        value = item_field.get("value")
+        if value is None:
+            continue
+        for name in (item_field.get("id"), item_field.get("label")):
+            if name:
+                fields.setdefault(name, str(value))
+    return fields
+
+
+def _max_age(cache_control: str | None) -> float | None:
+    """Return how long a Cache-Control header allows reuse, or None if it doesn't say.
+
+    no-store and no-cache count as 0, so the value is not cached.
+    """
+    if not cache_control:
+        return None
+
+    max_age = None
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name in ("no-store", "no-cache"):
+            return 0.0
+        if name == "max-age":
+            try:
+                max_age = max(float(value.strip('" ')), 0.0)
+            except ValueError:
+                continue
+    return max_age
+
+
 def create_provider() -> OnePasswordProvider:
     """Factory function to create a OnePasswordProvider instance."""
     return OnePasswordProvider()